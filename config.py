@@ -8,10 +8,13 @@ import sys
 import configparser
 import logging
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+CONFIG_FILE = 'config.ini'
+
+@dataclass(frozen=True)
 class Config:
     """Configuration settings for the router monitor."""
     community: str
@@ -29,9 +32,62 @@ class Config:
     db_pool_max_size: int
     db_connection_timeout: int
     request_interval: float = 0.1
+    snmp_capture_errors: bool = False
+    drop_expired_partitions: bool = True
+    stats_retention_days: int = 0
+
+def _to_bool(value: str) -> bool:
+    """Convert a config value to bool using configparser's boolean states."""
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
+
+# Mapping of Config fields to (section, option, converter) in config.ini
+_CONFIG_FIELDS = {
+    'community': ('snmp', 'community', str),
+    'port': ('snmp', 'port', int),
+    'timeout': ('snmp', 'timeout', int),
+    'retries': ('snmp', 'retries', int),
+    'request_interval': ('snmp', 'request_interval', float),
+    'snmp_capture_errors': ('snmp', 'capture_errors', _to_bool),
+    'db_host': ('database', 'host', str),
+    'db_user': ('database', 'user', str),
+    'db_password': ('database', 'password', str),
+    'db_name': ('database', 'name', str),
+    'db_pool_size': ('database', 'pool_size', int),
+    'db_pool_max_size': ('database', 'pool_max_size', int),
+    'db_connection_timeout': ('database', 'connection_timeout', int),
+    'max_concurrent_routers': ('monitor', 'max_concurrent_routers', int),
+    'partition_interval_days': ('monitor', 'partition_interval_days', int),
+    'failed_routers_file': ('monitor', 'failed_routers_file', str),
+    'drop_expired_partitions': ('monitor', 'drop_expired_partitions', _to_bool),
+    'stats_retention_days': ('monitor', 'stats_retention_days', int),
+}
+
+# Last parsed configuration, keyed by (st_mtime_ns, st_size) of the config file
+_CONFIG_CACHE: Optional[Tuple[Tuple[int, int], Config]] = None
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """Return the cache key for a config file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 def load_config() -> Config:
-    """Load configuration from config.ini file."""
+    """
+    Load configuration from config.ini file.
+    
+    The parsed Config is cached and returned as-is while config.ini is unchanged.
+    """
+    global _CONFIG_CACHE
+    
+    stat_key = _stat_key(CONFIG_FILE)
+    if stat_key is not None and _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stat_key:
+        return _CONFIG_CACHE[1]
+    
     config_parser = configparser.ConfigParser()
     
     # Set default values
@@ -41,7 +97,8 @@ def load_config() -> Config:
             'port': '161',
             'timeout': '2',
             'retries': '2',
-            'request_interval': '0.1'
+            'request_interval': '0.1',
+            'capture_errors': 'false'
         },
         'database': {
             'host': 'localhost',
@@ -55,7 +112,9 @@ def load_config() -> Config:
         'monitor': {
             'max_concurrent_routers': '10',
             'partition_interval_days': '30',
-            'failed_routers_file': 'failed_routers.txt'
+            'failed_routers_file': 'failed_routers.txt',
+            'drop_expired_partitions': 'true',
+            'stats_retention_days': '0'
         }
     }
     
@@ -63,35 +122,25 @@ def load_config() -> Config:
     config_parser.read_dict(default_config)
     
     # Try to read from config file
-    if os.path.exists('config.ini'):
-        config_parser.read('config.ini')
+    if stat_key is not None:
+        config_parser.read(CONFIG_FILE)
     else:
-        logger.warning("Config file 'config.ini' not found, using default values")
+        logger.warning(f"Config file '{CONFIG_FILE}' not found, using default values")
         # Create default config file
-        with open('config.ini', 'w') as config_file:
+        with open(CONFIG_FILE, 'w') as config_file:
             config_parser.write(config_file)
-        logger.info("Created default config file 'config.ini'")
+        logger.info(f"Created default config file '{CONFIG_FILE}'")
+        stat_key = _stat_key(CONFIG_FILE)
     
-    # Extract values from config
+    # Extract values from config in a single pass
     try:
-        config = Config(
-            community=config_parser.get('snmp', 'community'),
-            port=config_parser.getint('snmp', 'port'),
-            timeout=config_parser.getint('snmp', 'timeout'),
-            retries=config_parser.getint('snmp', 'retries'),
-            db_host=config_parser.get('database', 'host'),
-            db_user=config_parser.get('database', 'user'),
-            db_password=config_parser.get('database', 'password'),
-            db_name=config_parser.get('database', 'name'),
-            max_concurrent_routers=config_parser.getint('monitor', 'max_concurrent_routers'),
-            partition_interval_days=config_parser.getint('monitor', 'partition_interval_days'),
-            failed_routers_file=config_parser.get('monitor', 'failed_routers_file'),
-            db_pool_size=config_parser.getint('database', 'pool_size'),
-            db_pool_max_size=config_parser.getint('database', 'pool_max_size'),
-            db_connection_timeout=config_parser.getint('database', 'connection_timeout'),
-            request_interval=config_parser.getfloat('snmp', 'request_interval')
-        )
+        values = {}
+        for field_name, (section, option, convert) in _CONFIG_FIELDS.items():
+            values[field_name] = convert(config_parser.get(section, option))
+        config = Config(**values)
         
+        if stat_key is not None:
+            _CONFIG_CACHE = (stat_key, config)
         return config
     except (configparser.Error, ValueError) as e:
         logger.error(f"Error loading configuration: {e}")
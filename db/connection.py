@@ -3,10 +3,13 @@ Database connection management for the Router Network Interface Monitor.
 Provides a connection pool and context manager for database connections.
 """
 
+import hashlib
 import logging
+import random
+import threading
 import time
 from contextlib import contextmanager
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 import mysql.connector
 from mysql.connector import Error, pooling
@@ -15,94 +18,209 @@ from ..config import Config
 
 logger = logging.getLogger(__name__)
 
-# Global connection pool
-connection_pool = None
+# (db_host, db_user, db_name, db_pool_max_size)
+PoolKey = Tuple[str, str, str, int]
 
-def initialize_connection_pool(config: Config):
-    """Initialize the database connection pool."""
-    global connection_pool
+# Upper bound for a single retry backoff, in seconds
+MAX_BACKOFF = 30.0
+
+# Consecutive query failures that open the circuit, and how long it stays open
+CIRCUIT_FAILURE_THRESHOLD = 10
+CIRCUIT_COOLDOWN = 30.0
+
+
+class RetryBudget:
+    """Thread-safe token bucket used to cap the global rate of query retries."""
     
-    if connection_pool is not None:
-        logger.debug("Connection pool already initialized")
-        return
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
     
-    try:
-        logger.info(f"Initializing database connection pool with size {config.db_pool_size}-{config.db_pool_max_size}")
-        
-        # Create a pool name using the database credentials to ensure uniqueness
-        pool_name = f"router_monitor_pool_{config.db_host}_{config.db_name}"
-        
-        pool_config = {
-            "pool_name": pool_name,
-            "pool_size": config.db_pool_size,
-            "pool_reset_session": True,
-            "host": config.db_host,
-            "user": config.db_user,
-            "password": config.db_password,
-            "database": config.db_name,
-            "use_pure": True,
-            "connection_timeout": config.db_connection_timeout,
-            "autocommit": False,
-        }
-        
-        connection_pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
-        logger.info("Database connection pool initialized successfully")
+    def try_acquire(self) -> bool:
+        """Take one token if available, without blocking."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+# Shared retry budget and circuit breaker state for execute_with_retry. These
+# are process-wide, not per pool: only one database server per process is
+# supported, and failures against it fail queries on every pool fast
+_retry_budget = RetryBudget(rate=10, burst=50)
+_circuit_lock = threading.Lock()
+_consecutive_failures = 0
+_circuit_open_until = 0.0
+
+# Connection pools keyed by _pool_key(config)
+_pools: Dict[PoolKey, pooling.MySQLConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def _pool_key(config: Config) -> PoolKey:
+    """Return the registry key identifying the pool for a configuration."""
+    return (config.db_host, config.db_user, config.db_name, config.db_pool_max_size)
+
+def initialize_connection_pool(config: Config) -> pooling.MySQLConnectionPool:
+    """Initialize the database connection pool for a configuration, or return the existing one."""
+    key = _pool_key(config)
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+    
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is not None:
+            logger.debug("Connection pool already initialized")
+            return pool
         
-    except Error as e:
-        logger.error(f"Error initializing connection pool: {e}")
-        raise
+        try:
+            logger.info(f"Initializing database connection pool with size {config.db_pool_max_size}")
+            
+            # mysql-connector limits pool names to 64 characters from a small set,
+            # so name the pool by a hash of its registry key
+            key_hash = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+            pool_name = f"router_monitor_pool_{key_hash}"
+            
+            pool_config = {
+                "pool_name": pool_name,
+                # mysql-connector pools have a single fixed size, so use the maximum
+                "pool_size": config.db_pool_max_size,
+                # Keep session state between checkouts; db_connection() rolls back
+                # any open transaction before a connection is returned
+                "pool_reset_session": False,
+                "host": config.db_host,
+                "user": config.db_user,
+                "password": config.db_password,
+                "database": config.db_name,
+                # Use the C extension when it is installed
+                "use_pure": False,
+                "connection_timeout": config.db_connection_timeout,
+                "autocommit": False,
+            }
+            
+            # The pool opens all pool_size connections here, so handshakes happen at startup
+            pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
+            _pools[key] = pool
+            logger.info("Database connection pool initialized successfully")
+            return pool
+            
+        except Error as e:
+            logger.error(f"Error initializing connection pool: {e}")
+            raise
+
+def warmup_pools(configs: Iterable[Config]):
+    """Create the connection pools, and so open their connections, for the given configurations."""
+    for config in configs:
+        try:
+            initialize_connection_pool(config)
+        except Error:
+            # Already logged; the first query will retry initialization
+            pass
+
+def reset_pools():
+    """Close the idle connections of all pools and forget them so the next use creates fresh ones."""
+    with _pools_lock:
+        for pool in _pools.values():
+            try:
+                # mysql-connector has no public API for closing a pool's connections;
+                # _remove_connections() closes the idle ones, so call this while
+                # none are checked out
+                pool._remove_connections()
+            except Error as e:
+                logger.warning(f"Error closing pooled connections: {e}")
+        _pools.clear()
 
 @contextmanager
 def db_connection(config: Config):
     """Context manager for database connection from pool."""
-    global connection_pool
-    connection = None
-    
-    # Initialize pool if it doesn't exist
-    if connection_pool is None:
-        initialize_connection_pool(config)
+    pool = initialize_connection_pool(config)
     
     max_retries = 3
     retry_count = 0
     
-    while retry_count < max_retries:
+    while True:
         try:
             # Get connection from pool
-            connection = connection_pool.get_connection()
-            logger.debug("Acquired connection from pool")
-            yield connection
+            connection = pool.get_connection()
             break
         except Error as e:
             retry_count += 1
             logger.error(f"Error getting connection from pool (attempt {retry_count}/{max_retries}): {e}")
             if retry_count >= max_retries:
                 raise
-            # Brief pause before retrying
-            time.sleep(0.5)
-        finally:
-            if connection:
-                try:
-                    # Return the connection to the pool
-                    connection.close()
-                    logger.debug("Returned connection to pool")
-                except Error as e:
-                    logger.warning(f"Error returning connection to pool: {e}")
-
-def execute_with_retry(cursor, query, params=None, max_retries=3):
-    """Execute a database query with retry logic."""
+            # Brief, jittered pause before retrying
+            time.sleep(backoff_delay(retry_count, base=0.1))
+    
+    logger.debug("Acquired connection from pool")
+    try:
+        yield connection
+    finally:
+        try:
+            # End any transaction left open (e.g. by read-only
+            # queries) so it doesn't leak to the next borrower
+            if connection.in_transaction:
+                connection.rollback()
+            # Return the connection to the pool
+            connection.close()
+            logger.debug("Returned connection to pool")
+        except Error as e:
+            logger.warning("Error returning connection to pool: %s", e)
+
+def backoff_delay(retry_count: int, base: float = 0.5, cap: float = MAX_BACKOFF) -> float:
+    """Return an exponential backoff delay with full jitter."""
+    return random.uniform(0, min(cap, base * (2 ** retry_count)))
+
+def _record_query_result(success: bool):
+    """Update the circuit breaker after a query attempt."""
+    global _consecutive_failures, _circuit_open_until
+    with _circuit_lock:
+        if success:
+            _consecutive_failures = 0
+            return
+        _consecutive_failures += 1
+        if _consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+            _circuit_open_until = time.monotonic() + CIRCUIT_COOLDOWN
+            logger.error(f"Opening database circuit for {CIRCUIT_COOLDOWN:.0f}s after {_consecutive_failures} consecutive failures")
+            _consecutive_failures = 0
+
+def execute_with_retry(cursor, query, params=None, max_retries=3, many=False):
+    """
+    Execute a database query with retry logic (executemany if many=True).
+    
+    Retries draw from a shared token bucket, and repeated failures open a
+    circuit that fails queries fast for CIRCUIT_COOLDOWN seconds. Both are
+    process-wide, so all pools are assumed to point at the same database server.
+    """
+    if time.monotonic() < _circuit_open_until:
+        raise Error(msg="Database circuit open, not executing query")
+    
     retry_count = 0
     while retry_count < max_retries:
         try:
-            if params:
+            if many:
+                cursor.executemany(query, params)
+            elif params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
+            _record_query_result(True)
             return True
         except Error as e:
+            _record_query_result(False)
             retry_count += 1
-            backoff = 0.5 * (2 ** retry_count)  # Exponential backoff
-            logger.warning(f"Database query failed (attempt {retry_count}/{max_retries}): {e}")
+            backoff = backoff_delay(retry_count)  # Exponential backoff with full jitter
+            logger.warning("Database query failed (attempt %d/%d): %s", retry_count, max_retries, e)
             if retry_count >= max_retries:
                 raise
+            if time.monotonic() < _circuit_open_until or not _retry_budget.try_acquire():
+                logger.warning("Retry budget exhausted or circuit open, not retrying query")
+                raise
             time.sleep(backoff)
     return False
\ No newline at end of file
@@ -5,28 +5,139 @@ This module provides database operations for network interfaces and their statis
 It handles CRUD operations for interfaces and batch operations for interface statistics.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, time
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Any, Optional, Tuple
+from datetime import datetime, timedelta
 import mysql.connector
 from mysql.connector import Error
 
 from .connection import db_connection, execute_with_retry
+from .schema import drop_partitions_before, get_partitions, purge_default_partition
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Number of rows fetched per round when streaming interface statistics
+STATS_FETCH_SIZE = 1000
 
-async def get_interface_by_id(interface_id: int, config) -> Optional[Dict[str, Any]]:
+# Maximum number of rows per multi-row interface_stats INSERT
+STATS_INSERT_CHUNK_SIZE = 1000
+
+# Row templates for the derived table of stats values in a batch INSERT
+_STATS_FIRST_ROW_SQL = (
+    "SELECT %s AS router_id, %s AS ifIndex, %s AS timestamp, %s AS ifAdminStatus, %s AS ifOperStatus, "
+    "%s AS ifInOctets, %s AS ifOutOctets, %s AS ifHCInOctets, %s AS ifHCOutOctets"
+)
+_STATS_ROW_SQL = "SELECT %s, %s, %s, %s, %s, %s, %s, %s, %s"
+
+# Queued stats rows are flushed once this many are pending...
+STATS_FLUSH_ROWS = 5000
+
+# ...or once the oldest pending row has waited this many seconds
+STATS_FLUSH_INTERVAL = 1.0
+
+# Lists of stats rows from all routers, consumed by stats_writer(); None stops it
+_stats_queue: asyncio.Queue = asyncio.Queue()
+
+
+@functools.lru_cache(maxsize=8)
+def _stats_insert_sql(row_count: int) -> str:
     """
-    Retrieve interface details by interface ID.
+    Build the multi-row interface_stats INSERT for a given number of rows.
+
+    Full chunks all share one length, so the statement text is built once
+    and reused for every batch.
+
+    Args:
+        row_count: Number of rows in the derived values table
+
+    Returns:
+        str: INSERT ... SELECT statement with 9 placeholders per row
+    """
+    rows_sql = " UNION ALL ".join(
+        [_STATS_FIRST_ROW_SQL] + [_STATS_ROW_SQL] * (row_count - 1)
+    )
+    return f"""
+        INSERT INTO interface_stats 
+        (interface_id, timestamp, ifAdminStatus, ifOperStatus, 
+         ifInOctets, ifOutOctets, ifHCInOctets, ifHCOutOctets)
+        SELECT i.interface_id, v.timestamp, v.ifAdminStatus, v.ifOperStatus,
+               v.ifInOctets, v.ifOutOctets, v.ifHCInOctets, v.ifHCOutOctets
+        FROM ({rows_sql}) AS v
+        JOIN interfaces i ON i.router_id = v.router_id AND i.ifIndex = v.ifIndex
+        """
+
+
+def _stats_rows(interfaces_data: List[Dict[str, Any]], router_id: int) -> List[tuple]:
+    """
+    Build interface_stats insert rows for one router.
+    
+    Interface IDs are resolved from (router_id, ifIndex) at insert time. Rows are
+    stamped now, when the poll's data arrives, so queued rows keep their poll
+    time however late they are flushed.
     
     Args:
-        interface_id: The unique ID of the interface
+        interfaces_data: List of interface data dictionaries
+        router_id: The ID of the router these interfaces belong to
+        
+    Returns:
+        List[tuple]: (router_id, ifIndex, timestamp, status and counter values) per interface
+    """
+    timestamp = datetime.now()
+    stats_values = []
+    append = stats_values.append
+    for interface in interfaces_data:
+        # Counters are parsed as ints upstream; missing values become 0
+        get = interface.get
+        append((
+            router_id,
+            get('ifIndex'),
+            timestamp,
+            get('ifAdminStatus') or 0,
+            get('ifOperStatus') or 0,
+            get('ifInOctets') or 0,
+            get('ifOutOctets') or 0,
+            get('ifHCInOctets') or 0,
+            get('ifHCOutOctets') or 0
+        ))
+    return stats_values
+
+
+def _write_stats_rows(stats_values: List[tuple], config) -> int:
+    """
+    Insert stats rows, which may span several routers, and commit.
+    
+    Each chunk is sent as one multi-row statement that joins the rows against
+    interfaces to look up their IDs.
+    
+    Args:
+        stats_values: Rows as built by _stats_rows()
         config: Application configuration
         
     Returns:
-        Optional[Dict[str, Any]]: Interface information or None if not found
+        int: Number of rows inserted; rows for unknown interfaces are skipped
+        
+    Raises:
+        Error: If the insert fails
     """
+    with db_connection(config) as connection:
+        cursor = connection.cursor()
+        saved_count = 0
+        for start in range(0, len(stats_values), STATS_INSERT_CHUNK_SIZE):
+            chunk = stats_values[start:start + STATS_INSERT_CHUNK_SIZE]
+            params = [value for row in chunk for value in row]
+            execute_with_retry(cursor, _stats_insert_sql(len(chunk)), params)
+            saved_count += cursor.rowcount
+        connection.commit()
+        return saved_count
+
+
+def _get_interface_by_id(interface_id: int, config) -> Optional[Dict[str, Any]]:
+    """Blocking implementation of get_interface_by_id()."""
     try:
         with db_connection(config) as connection:
             cursor = connection.cursor(dictionary=True)
@@ -44,17 +155,22 @@ async def get_interface_by_id(interface_id: int, config) -> Optional[Dict[str, A
         return None
 
 
-async def get_interfaces_by_router_id(router_id: int, config) -> List[Dict[str, Any]]:
+async def get_interface_by_id(interface_id: int, config) -> Optional[Dict[str, Any]]:
     """
-    Retrieve all interfaces for a specific router.
+    Retrieve interface details by interface ID.
     
     Args:
-        router_id: The ID of the router
+        interface_id: The unique ID of the interface
         config: Application configuration
         
     Returns:
-        List[Dict[str, Any]]: List of interface dictionaries
+        Optional[Dict[str, Any]]: Interface information or None if not found
     """
+    return await asyncio.to_thread(_get_interface_by_id, interface_id, config)
+
+
+def _get_interfaces_by_router_id(router_id: int, config) -> List[Dict[str, Any]]:
+    """Blocking implementation of get_interfaces_by_router_id()."""
     try:
         with db_connection(config) as connection:
             cursor = connection.cursor(dictionary=True)
@@ -72,116 +188,98 @@ async def get_interfaces_by_router_id(router_id: int, config) -> List[Dict[str,
         return []
 
 
-async def get_interface_id_map(router_id: int, config) -> Dict[str, int]:
+async def get_interfaces_by_router_id(router_id: int, config) -> List[Dict[str, Any]]:
     """
-    Get mapping between interface indices and their database IDs for a router.
+    Retrieve all interfaces for a specific router.
     
     Args:
         router_id: The ID of the router
         config: Application configuration
         
     Returns:
-        Dict[str, int]: Dictionary mapping ifIndex to interface_id
+        List[Dict[str, Any]]: List of interface dictionaries
     """
+    return await asyncio.to_thread(_get_interfaces_by_router_id, router_id, config)
+
+
+def _get_interface_id_map(router_id: int, config) -> Dict[str, int]:
+    """Blocking implementation of get_interface_id_map()."""
     try:
         with db_connection(config) as connection:
             cursor = connection.cursor()
             execute_with_retry(
                 cursor,
-                "SELECT interface_id, ifIndex FROM interfaces WHERE router_id = %s",
+                "SELECT ifIndex, interface_id FROM interfaces WHERE router_id = %s",
                 (router_id,)
             )
             
-            interface_map = {}
-            for row in cursor.fetchall():
-                interface_map[row[1]] = row[0]  # Map ifIndex to interface_id
-                
-            return interface_map
+            # Rows are (ifIndex, interface_id) pairs
+            return dict(cursor.fetchall())
     except Error as e:
         logger.error(f"Database error getting interface ID map for router {router_id}: {e}")
         return {}
 
 
-async def save_or_update_interfaces(router_id: int, interfaces: Dict[str, Dict[str, Any]], config) -> bool:
+async def get_interface_id_map(router_id: int, config) -> Dict[str, int]:
     """
-    Save or update interfaces for a router in the database.
+    Get mapping between interface indices and their database IDs for a router.
     
     Args:
-        router_id: The ID of the router these interfaces belong to
-        interfaces: Dictionary of interfaces keyed by ifIndex
+        router_id: The ID of the router
         config: Application configuration
         
     Returns:
-        bool: True if successful, False otherwise
+        Dict[str, int]: Dictionary mapping ifIndex to interface_id
     """
+    return await asyncio.to_thread(_get_interface_id_map, router_id, config)
+
+
+def _save_or_update_interfaces(router_id: int, interfaces: Dict[str, Dict[str, Any]], config) -> bool:
+    """Blocking implementation of save_or_update_interfaces()."""
     try:
         with db_connection(config) as connection:
             cursor = connection.cursor()
             
-            # Process interfaces
-            for if_index, interface in interfaces.items():
-                # Check if interface exists
+            rows = [
+                (
+                    router_id,
+                    if_index,
+                    interface.get('ifName'),
+                    interface.get('ifDescr'),
+                    interface.get('ifType'),
+                    interface.get('ifMTU'),
+                    interface.get('ifSpeed'),
+                    interface.get('ifPhysAddress'),
+                    interface.get('ifHighSpeed'),
+                    interface.get('ifAlias'),
+                    interface.get('ipAddresses')
+                )
+                for if_index, interface in interfaces.items()
+            ]
+            
+            # Insert new interfaces and update existing ones in a single batch,
+            # relying on the UNIQUE (router_id, ifIndex) index
+            if rows:
                 execute_with_retry(
                     cursor,
-                    "SELECT interface_id FROM interfaces WHERE router_id = %s AND ifIndex = %s",
-                    (router_id, if_index)
+                    """
+                    INSERT INTO interfaces
+                    (router_id, ifIndex, ifName, ifDescr, ifType, ifMTU,
+                     ifSpeed, ifPhysAddress, ifHighSpeed, ifAlias, ipAddresses)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE
+                        ifName = VALUES(ifName), ifDescr = VALUES(ifDescr),
+                        ifType = VALUES(ifType), ifMTU = VALUES(ifMTU),
+                        ifSpeed = VALUES(ifSpeed), ifPhysAddress = VALUES(ifPhysAddress),
+                        ifHighSpeed = VALUES(ifHighSpeed), ifAlias = VALUES(ifAlias),
+                        ipAddresses = VALUES(ipAddresses)
+                    """,
+                    rows,
+                    many=True
                 )
-                if_result = cursor.fetchone()
-                
-                if if_result:
-                    # Update existing interface
-                    interface_id = if_result[0]
-                    execute_with_retry(
-                        cursor,
-                        """
-                        UPDATE interfaces 
-                        SET ifName = %s, ifDescr = %s, ifType = %s, ifMTU = %s,
-                            ifSpeed = %s, ifPhysAddress = %s, ifHighSpeed = %s,
-                            ifAlias = %s, ipAddresses = %s
-                        WHERE interface_id = %s
-                        """,
-                        (
-                            interface.get('ifName'),
-                            interface.get('ifDescr'),
-                            interface.get('ifType'),
-                            interface.get('ifMTU'),
-                            interface.get('ifSpeed'),
-                            interface.get('ifPhysAddress'),
-                            interface.get('ifHighSpeed'),
-                            interface.get('ifAlias'),
-                            interface.get('ipAddresses'),
-                            interface_id
-                        )
-                    )
-                    logger.debug(f"Updated interface {if_index} for router {router_id}")
-                else:
-                    # Insert new interface
-                    execute_with_retry(
-                        cursor,
-                        """
-                        INSERT INTO interfaces
-                        (router_id, ifIndex, ifName, ifDescr, ifType, ifMTU,
-                         ifSpeed, ifPhysAddress, ifHighSpeed, ifAlias, ipAddresses)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """,
-                        (
-                            router_id,
-                            if_index,
-                            interface.get('ifName'),
-                            interface.get('ifDescr'),
-                            interface.get('ifType'),
-                            interface.get('ifMTU'),
-                            interface.get('ifSpeed'),
-                            interface.get('ifPhysAddress'),
-                            interface.get('ifHighSpeed'),
-                            interface.get('ifAlias'),
-                            interface.get('ipAddresses')
-                        )
-                    )
-                    logger.debug(f"Inserted new interface {if_index} for router {router_id}")
             
             connection.commit()
-            logger.info(f"Saved {len(interfaces)} interfaces for router {router_id}")
+            logger.info("Saved %d interfaces for router %s", len(interfaces), router_id)
             return True
             
     except Error as e:
@@ -189,6 +287,40 @@ async def save_or_update_interfaces(router_id: int, interfaces: Dict[str, Dict[s
         return False
 
 
+async def save_or_update_interfaces(router_id: int, interfaces: Dict[str, Dict[str, Any]], config) -> bool:
+    """
+    Save or update interfaces for a router in the database.
+    
+    Args:
+        router_id: The ID of the router these interfaces belong to
+        interfaces: Dictionary of interfaces keyed by ifIndex
+        config: Application configuration
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return await asyncio.to_thread(_save_or_update_interfaces, router_id, interfaces, config)
+
+
+def _save_interface_stats_batch(interfaces_data: List[Dict[str, Any]], router_id: int, config) -> bool:
+    """Blocking implementation of save_interface_stats_batch()."""
+    stats_values = _stats_rows(interfaces_data, router_id)
+    if not stats_values:
+        logger.warning("No valid interface statistics to save for router_id %s", router_id)
+        return False
+    
+    try:
+        saved_count = _write_stats_rows(stats_values, config)
+    except Error as e:
+        logger.error(f"Database error saving interface statistics: {e}")
+        return False
+    
+    if saved_count < len(stats_values):
+        logger.warning("%d interfaces not found in database for router_id %s", len(stats_values) - saved_count, router_id)
+    logger.info("Saved %d interface statistics records", saved_count)
+    return saved_count > 0
+
+
 async def save_interface_stats_batch(interfaces_data: List[Dict[str, Any]], router_id: int, config) -> bool:
     """
     Save interface statistics in batch mode for better performance.
@@ -201,95 +333,119 @@ async def save_interface_stats_batch(interfaces_data: List[Dict[str, Any]], rout
     Returns:
         bool: True if successful, False otherwise
     """
+    return await asyncio.to_thread(_save_interface_stats_batch, interfaces_data, router_id, config)
+
+
+def queue_interface_stats(interfaces_data: List[Dict[str, Any]], router_id: int) -> int:
+    """
+    Queue interface statistics for the shared stats_writer() task.
+    
+    Rows from all routers are combined into large cross-router INSERT batches
+    instead of one small batch per router.
+    
+    Args:
+        interfaces_data: List of interface data dictionaries
+        router_id: The ID of the router these interfaces belong to
+        
+    Returns:
+        int: Number of rows queued
+    """
+    stats_values = _stats_rows(interfaces_data, router_id)
+    if stats_values:
+        _stats_queue.put_nowait(stats_values)
+    return len(stats_values)
+
+
+async def _flush_stats_rows(stats_values: List[tuple], config):
+    """Write queued stats rows in a worker thread, logging any failure."""
     try:
-        with db_connection(config) as connection:
-            cursor = connection.cursor()
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # First, get all interface IDs for this router
-            interface_map = await get_interface_id_map(router_id, config)
-            
-            if not interface_map:
-                logger.error(f"No interfaces found in database for router_id {router_id}")
-                return False
-            
-            # Prepare batch insert for interface stats
-            stats_values = []
-            for interface in interfaces_data:
-                if_index = interface.get('ifIndex')
-                if if_index not in interface_map:
-                    logger.warning(f"Interface with index {if_index} not found in database for router_id {router_id}")
-                    continue
-                
-                interface_id = interface_map[if_index]
-                
-                # Collect stats data - convert values to ensure they're numeric
-                stats_values.append((
-                    interface_id,
-                    current_time,
-                    int(interface.get('ifAdminStatus', 0) or 0),
-                    int(interface.get('ifOperStatus', 0) or 0),
-                    int(interface.get('ifInOctets', 0) or 0),
-                    int(interface.get('ifOutOctets', 0) or 0),
-                    int(interface.get('ifHCInOctets', 0) or 0),
-                    int(interface.get('ifHCOutOctets', 0) or 0)
-                ))
-            
-            # Insert stats in batch if we have any
-            if stats_values:
-                # Use executemany with retry for batch inserts
-                max_retries = 3
-                retry_count = 0
-                success = False
-                
-                while retry_count < max_retries and not success:
-                    try:
-                        cursor.executemany(
-                            """
-                            INSERT INTO interface_stats 
-                            (interface_id, timestamp, ifAdminStatus, ifOperStatus, 
-                             ifInOctets, ifOutOctets, ifHCInOctets, ifHCOutOctets)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                            """,
-                            stats_values
-                        )
-                        connection.commit()
-                        success = True
-                    except Error as e:
-                        retry_count += 1
-                        logger.error(f"Database error in batch insert (attempt {retry_count}/{max_retries}): {e}")
-                        if retry_count >= max_retries:
-                            raise
-                        time.sleep(0.5 * (2 ** retry_count))  # Exponential backoff
-                
-                logger.info(f"Saved {len(stats_values)} interface statistics records")
-                return success
-            else:
-                logger.warning(f"No valid interface statistics to save for router_id {router_id}")
-                return False
-                
+        saved_count = await asyncio.to_thread(_write_stats_rows, stats_values, config)
     except Error as e:
-        logger.error(f"Database error saving interface statistics: {e}")
-        return False
+        logger.error("Database error flushing %d queued interface statistics: %s", len(stats_values), e)
+        return
+    if saved_count < len(stats_values):
+        logger.warning("%d queued interface statistics had no matching interface", len(stats_values) - saved_count)
+    logger.info("Saved %d interface statistics records", saved_count)
 
 
-async def get_interface_stats(interface_id: int, start_time: datetime, end_time: datetime, config) -> List[Dict[str, Any]]:
+async def stats_writer(config, flush_rows: int = STATS_FLUSH_ROWS,
+                       flush_interval: float = STATS_FLUSH_INTERVAL):
     """
-    Retrieve interface statistics for a specific time range.
+    Consume queued interface statistics and write them in cross-router batches.
+    
+    Pending rows are flushed once flush_rows accumulate or the oldest has waited
+    flush_interval seconds. Remaining rows are flushed when stop_stats_writer()
+    is called.
+    
+    Args:
+        config: Application configuration
+        flush_rows: Pending row count that triggers a flush
+        flush_interval: Maximum seconds a row waits before being flushed
+    """
+    loop = asyncio.get_running_loop()
+    pending: List[tuple] = []
+    deadline = None
+    while True:
+        timeout = None if deadline is None else max(0.0, deadline - loop.time())
+        try:
+            stats_values = await asyncio.wait_for(_stats_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            stats_values = []
+        
+        if stats_values is None:
+            break
+        if stats_values and not pending:
+            deadline = loop.time() + flush_interval
+        pending.extend(stats_values)
+        
+        if pending and (len(pending) >= flush_rows or loop.time() >= deadline):
+            await _flush_stats_rows(pending, config)
+            pending = []
+            deadline = None
+    
+    if pending:
+        await _flush_stats_rows(pending, config)
+
+
+def stop_stats_writer():
+    """Ask stats_writer() to flush what is queued so far and exit."""
+    _stats_queue.put_nowait(None)
+
+
+def _close_stats_stream(connection_cm, connection):
+    """Blocking cleanup for iter_interface_stats(): drain unread rows and release the connection."""
+    try:
+        # Drain unread rows if the consumer stopped early
+        connection.consume_results()
+    finally:
+        connection_cm.__exit__(None, None, None)
+
+
+async def iter_interface_stats(interface_id: int, start_time: datetime, end_time: datetime, config,
+                               batch_size: int = STATS_FETCH_SIZE) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Stream interface statistics for a specific time range in timestamp order.
+    
+    Rows are read from an unbuffered cursor, so at most one batch is held in memory.
+    Checking the connection out, every read and releasing it run in worker threads.
     
     Args:
         interface_id: The ID of the interface
         start_time: Beginning of time range
         end_time: End of time range
         config: Application configuration
+        batch_size: Maximum number of rows per yielded batch
         
-    Returns:
-        List[Dict[str, Any]]: Interface statistics records
+    Yields:
+        List[Dict[str, Any]]: Batches of interface statistics records
     """
     try:
-        with db_connection(config) as connection:
-            cursor = connection.cursor(dictionary=True)
-            execute_with_retry(
+        connection_cm = db_connection(config)
+        connection = await asyncio.to_thread(connection_cm.__enter__)
+        try:
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            await asyncio.to_thread(
+                execute_with_retry,
                 cursor,
                 """
                 SELECT * FROM interface_stats 
@@ -298,26 +454,54 @@ async def get_interface_stats(interface_id: int, start_time: datetime, end_time:
                 """,
                 (interface_id, start_time, end_time)
             )
-            return cursor.fetchall()
+            while True:
+                rows = await asyncio.to_thread(cursor.fetchmany, batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            await asyncio.to_thread(_close_stats_stream, connection_cm, connection)
     except Error as e:
         logger.error(f"Database error retrieving stats for interface {interface_id}: {e}")
-        return []
 
 
-async def delete_old_interface_stats(days_to_keep: int, config) -> bool:
+async def get_interface_stats(interface_id: int, start_time: datetime, end_time: datetime, config) -> List[Dict[str, Any]]:
     """
-    Delete interface statistics older than a specified number of days.
+    Retrieve interface statistics for a specific time range.
     
     Args:
-        days_to_keep: Keep statistics newer than this many days
+        interface_id: The ID of the interface
+        start_time: Beginning of time range
+        end_time: End of time range
         config: Application configuration
         
     Returns:
-        bool: True if successful, False otherwise
+        List[Dict[str, Any]]: Interface statistics records
     """
+    stats = []
+    async for rows in iter_interface_stats(interface_id, start_time, end_time, config):
+        stats.extend(rows)
+    return stats
+
+
+def _delete_old_interface_stats(days_to_keep: int, config) -> bool:
+    """Blocking implementation of delete_old_interface_stats()."""
     try:
         with db_connection(config) as connection:
             cursor = connection.cursor()
+            
+            if config.drop_expired_partitions:
+                partitions = get_partitions(cursor)
+                
+                # Only drop partitions if the table is actually partitioned
+                if partitions:
+                    cutoff = datetime.now().date() - timedelta(days=days_to_keep)
+                    drop_partitions_before(cursor, partitions, cutoff)
+                    if 'p_default' in partitions:
+                        purge_default_partition(cursor, cutoff)
+                        connection.commit()
+                    return True
+            
             execute_with_retry(
                 cursor,
                 """
@@ -335,6 +519,139 @@ async def delete_old_interface_stats(days_to_keep: int, config) -> bool:
         return False
 
 
+async def delete_old_interface_stats(days_to_keep: int, config) -> bool:
+    """
+    Delete interface statistics older than a specified number of days.
+    
+    When interface_stats is partitioned and config.drop_expired_partitions is set,
+    partitions that lie entirely before the cutoff are dropped instead of deleting
+    rows, so retention is applied at partition granularity.
+    
+    Args:
+        days_to_keep: Keep statistics newer than this many days
+        config: Application configuration
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return await asyncio.to_thread(_delete_old_interface_stats, days_to_keep, config)
+
+
+def _delete_orphan_interface_stats(config) -> bool:
+    """Blocking implementation of delete_orphan_interface_stats()."""
+    try:
+        with db_connection(config) as connection:
+            cursor = connection.cursor()
+            execute_with_retry(
+                cursor,
+                """
+                DELETE s FROM interface_stats s
+                LEFT JOIN interfaces i ON i.interface_id = s.interface_id
+                WHERE i.interface_id IS NULL
+                """
+            )
+            deleted_count = cursor.rowcount
+            connection.commit()
+            logger.info("Deleted %d interface statistics records for removed interfaces", deleted_count)
+            return True
+    except Error as e:
+        logger.error("Database error deleting orphaned statistics: %s", e)
+        return False
+
+
+async def delete_orphan_interface_stats(config) -> bool:
+    """
+    Delete interface statistics whose interface no longer exists.
+    
+    interface_stats has no foreign key to interfaces, so removing an interface
+    or router leaves its statistics behind until they expire with their
+    partition or are swept by this function.
+    
+    Args:
+        config: Application configuration
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return await asyncio.to_thread(_delete_orphan_interface_stats, config)
+
+
+def _octet_deltas(stats: List[Dict[str, Any]], hc_key: str, key: str) -> "np.ndarray":
+    """
+    Compute per-sample octet deltas, preferring HC counters and handling resets.
+    
+    Args:
+        stats: Interface statistics records in timestamp order
+        hc_key: Name of the 64-bit counter column
+        key: Name of the 32-bit counter column
+        
+    Returns:
+        np.ndarray: Octet delta for each consecutive pair of samples
+    """
+    import numpy as np
+    
+    hc = np.fromiter((row[hc_key] or 0 for row in stats), dtype=np.int64, count=len(stats))
+    low = np.fromiter((row[key] or 0 for row in stats), dtype=np.int64, count=len(stats))
+    
+    # Use HC counters only when both samples of a pair have them
+    use_hc = (hc[1:] != 0) & (hc[:-1] != 0)
+    deltas = np.where(use_hc, np.diff(hc), np.diff(low))
+    
+    # On counter reset, count from zero using the current sample
+    current = np.where(hc[1:] != 0, hc[1:], low[1:])
+    return np.where(deltas < 0, current, deltas)
+
+
+def _samples_utilization(stats: List[Dict[str, Any]], speed_bps: float) -> List[Dict[str, Any]]:
+    """
+    Calculate utilization between each pair of consecutive samples.
+    
+    Args:
+        stats: At least two interface statistics records in timestamp order
+        speed_bps: Interface speed in bits per second
+        
+    Returns:
+        List[Dict[str, Any]]: Utilization records for each valid pair of samples
+    """
+    # NumPy is only needed for utilization analytics, not for polling or stats writes
+    import numpy as np
+    
+    timestamps = [row['timestamp'] for row in stats]
+    start = timestamps[0]
+    elapsed = np.array([(ts - start).total_seconds() for ts in timestamps])
+    time_diff = np.diff(elapsed)
+    
+    in_bytes = _octet_deltas(stats, 'ifHCInOctets', 'ifInOctets')
+    out_bytes = _octet_deltas(stats, 'ifHCOutOctets', 'ifOutOctets')
+    
+    # Skip pairs without a positive time difference
+    valid = time_diff > 0
+    time_diff = time_diff[valid]
+    
+    # Calculate bits per second
+    in_bps = (in_bytes[valid] * 8) / time_diff
+    out_bps = (out_bytes[valid] * 8) / time_diff
+    
+    # Calculate utilization as percentage of interface speed
+    in_utilization = (in_bps / speed_bps) * 100
+    out_utilization = (out_bps / speed_bps) * 100
+    
+    sample_times = [ts for ts, keep in zip(timestamps[1:], valid) if keep]
+    return [
+        {
+            'timestamp': timestamp,
+            'in_bps': in_rate,
+            'out_bps': out_rate,
+            'in_utilization': in_util,
+            'out_utilization': out_util
+        }
+        for timestamp, in_rate, out_rate, in_util, out_util in zip(
+            sample_times, in_bps.tolist(), out_bps.tolist(),
+            in_utilization.tolist(), out_utilization.tolist()
+        )
+    ]
+
+
 async def calculate_interface_utilization(interface_id: int, start_time: datetime, end_time: datetime, config) -> List[Dict[str, Any]]:
     """
     Calculate interface utilization over time.
@@ -364,50 +681,24 @@ async def calculate_interface_utilization(interface_id: int, start_time: datetim
             logger.warning(f"Interface {interface_id} has zero speed, can't calculate utilization")
             return []
         
-        # Get all statistics for this interface in the time range
-        stats = await get_interface_stats(interface_id, start_time, end_time, config)
-        if len(stats) < 2:
-            logger.warning(f"Not enough data points to calculate utilization for interface {interface_id}")
-            return []
+        # interface_speed is in Mbps, convert to bps
+        speed_bps = interface_speed * 1000000
         
-        # Calculate utilization between each pair of consecutive samples
+        # Stream statistics for this interface in the time range, carrying the
+        # last sample of each batch over so pairs spanning batches are kept
         utilization = []
-        for i in range(1, len(stats)):
-            prev = stats[i-1]
-            curr = stats[i]
-            
-            # Calculate time difference in seconds
-            time_diff = (curr['timestamp'] - prev['timestamp']).total_seconds()
-            if time_diff <= 0:
-                continue
-            
-            # Calculate byte differences, prefer HC counters
-            in_bytes = curr['ifHCInOctets'] - prev['ifHCInOctets'] if curr['ifHCInOctets'] and prev['ifHCInOctets'] else curr['ifInOctets'] - prev['ifInOctets']
-            out_bytes = curr['ifHCOutOctets'] - prev['ifHCOutOctets'] if curr['ifHCOutOctets'] and prev['ifHCOutOctets'] else curr['ifOutOctets'] - prev['ifOutOctets']
-            
-            # Handle counter resets
-            if in_bytes < 0:
-                in_bytes = curr['ifHCInOctets'] if curr['ifHCInOctets'] else curr['ifInOctets']
-            if out_bytes < 0:
-                out_bytes = curr['ifHCOutOctets'] if curr['ifHCOutOctets'] else curr['ifOutOctets']
-            
-            # Calculate bits per second
-            in_bps = (in_bytes * 8) / time_diff
-            out_bps = (out_bytes * 8) / time_diff
-            
-            # Calculate utilization as percentage of interface speed
-            # interface_speed is in Mbps, convert to bps
-            speed_bps = interface_speed * 1000000
-            in_utilization = (in_bps / speed_bps) * 100 if speed_bps > 0 else 0
-            out_utilization = (out_bps / speed_bps) * 100 if speed_bps > 0 else 0
-            
-            utilization.append({
-                'timestamp': curr['timestamp'],
-                'in_bps': in_bps,
-                'out_bps': out_bps,
-                'in_utilization': in_utilization,
-                'out_utilization': out_utilization
-            })
+        sample_count = 0
+        prev_row = None
+        async for rows in iter_interface_stats(interface_id, start_time, end_time, config):
+            sample_count += len(rows)
+            samples = rows if prev_row is None else [prev_row] + rows
+            prev_row = rows[-1]
+            if len(samples) >= 2:
+                utilization.extend(_samples_utilization(samples, speed_bps))
+        
+        if sample_count < 2:
+            logger.warning(f"Not enough data points to calculate utilization for interface {interface_id}")
+            return []
         
         return utilization
     except Exception as e:
@@ -3,8 +3,10 @@ Data Access Object for router operations.
 Handles database operations related to routers.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import os
+from typing import Dict, Any, Optional, List, Tuple
 
 from mysql.connector import Error
 
@@ -13,18 +15,8 @@ from .connection import db_connection, execute_with_retry
 
 logger = logging.getLogger(__name__)
 
-async def save_router(router_ip: str, router_info: Dict[str, Any], config: Config) -> Optional[int]:
-    """
-    Save or update router information in the database.
-    
-    Args:
-        router_ip: IP address of the router
-        router_info: Router information dictionary
-        config: Application configuration
-        
-    Returns:
-        Optional[int]: Router ID if successful, None otherwise
-    """
+def _save_router(router_ip: str, router_info: Dict[str, Any], config: Config) -> Optional[int]:
+    """Blocking implementation of save_router()."""
     try:
         with db_connection(config) as connection:
             cursor = connection.cursor()
@@ -58,7 +50,7 @@ async def save_router(router_ip: str, router_info: Dict[str, Any], config: Confi
                         router_id
                     )
                 )
-                logger.info(f"Updated router information for {router_ip} (ID: {router_id})")
+                logger.info("Updated router information for %s (ID: %s)", router_ip, router_id)
             else:
                 # Insert new router
                 execute_with_retry(
@@ -79,7 +71,7 @@ async def save_router(router_ip: str, router_info: Dict[str, Any], config: Confi
                     )
                 )
                 router_id = cursor.lastrowid
-                logger.info(f"Inserted new router {router_ip} with ID {router_id}")
+                logger.info("Inserted new router %s with ID %s", router_ip, router_id)
             
             connection.commit()
             return router_id
@@ -88,12 +80,97 @@ async def save_router(router_ip: str, router_info: Dict[str, Any], config: Confi
         logger.error(f"Database error saving router: {e}")
         return None
 
+async def save_router(router_ip: str, router_info: Dict[str, Any], config: Config) -> Optional[int]:
+    """
+    Save or update router information in the database.
+    
+    Args:
+        router_ip: IP address of the router
+        router_info: Router information dictionary
+        config: Application configuration
+        
+    Returns:
+        Optional[int]: Router ID if successful, None otherwise
+    """
+    return await asyncio.to_thread(_save_router, router_ip, router_info, config)
+
+def _save_routers_batch(routers: List[Tuple[str, Dict[str, Any]]], config: Config) -> Dict[str, int]:
+    """Blocking implementation of save_routers_batch()."""
+    if not routers:
+        return {}
+    
+    try:
+        with db_connection(config) as connection:
+            cursor = connection.cursor()
+            
+            rows = [
+                (
+                    router_ip,
+                    router_info.get('sysName'),
+                    router_info.get('sysDescr'),
+                    router_info.get('sysUpTime'),
+                    router_info.get('sysLocation'),
+                    router_info.get('sysContact'),
+                    router_info.get('sysObjectID')
+                )
+                for router_ip, router_info in routers
+            ]
+            
+            # Insert new routers and update existing ones, relying on the
+            # UNIQUE (ip_address) index
+            execute_with_retry(
+                cursor,
+                """
+                INSERT INTO routers 
+                (ip_address, sysName, sysDescr, sysUpTime, sysLocation, sysContact, sysObjectID)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    sysName = VALUES(sysName), sysDescr = VALUES(sysDescr),
+                    sysUpTime = VALUES(sysUpTime), sysLocation = VALUES(sysLocation),
+                    sysContact = VALUES(sysContact), sysObjectID = VALUES(sysObjectID)
+                """,
+                rows,
+                many=True
+            )
+            connection.commit()
+            
+            # Fetch the IDs of all saved routers in one query
+            router_ips = [row[0] for row in rows]
+            placeholders = ", ".join(["%s"] * len(router_ips))
+            execute_with_retry(
+                cursor,
+                f"SELECT ip_address, router_id FROM routers WHERE ip_address IN ({placeholders})",
+                router_ips
+            )
+            router_ids = dict(cursor.fetchall())
+            
+            logger.info(f"Saved information for {len(router_ids)} routers")
+            return router_ids
+            
+    except Error as e:
+        logger.error(f"Database error saving routers batch: {e}")
+        return {}
+
+async def save_routers_batch(routers: List[Tuple[str, Dict[str, Any]]], config: Config) -> Dict[str, int]:
+    """
+    Save or update information for many routers in a single batch.
+    
+    Args:
+        routers: List of (router IP address, router information dictionary) tuples
+        config: Application configuration
+        
+    Returns:
+        Dict[str, int]: Mapping of router IP address to router ID for saved routers
+    """
+    return await asyncio.to_thread(_save_routers_batch, routers, config)
+
 def save_failed_routers(failed_routers: List[str], filename: str):
-    """Save failed router IP addresses to a file."""
+    """Save failed router IP addresses to a file, replacing it atomically."""
+    tmp_filename = f"{filename}.tmp"
     try:
-        with open(filename, 'w') as file:
-            for router_ip in failed_routers:
-                file.write(f"{router_ip}\n")
+        with open(tmp_filename, 'w', buffering=-1) as file:
+            file.writelines(router_ip + "\n" for router_ip in failed_routers)
+        os.replace(tmp_filename, filename)
         logger.info(f"Saved {len(failed_routers)} failed routers to {filename}")
     except Exception as e:
         logger.error(f"Error saving failed routers to {filename}: {e}")
\ No newline at end of file
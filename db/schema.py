@@ -2,168 +2,350 @@
 Database schema creation and maintenance for the Router Network Interface Monitor.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
 
 from ..config import Config
 from .connection import db_connection, execute_with_retry, initialize_connection_pool
 
 logger = logging.getLogger(__name__)
 
-async def create_database_tables(config: Config) -> bool:
-    """Create the normalized database tables with time-based partitioning if configured."""
+# Bump whenever the DDL in create_tables() changes, and teach
+# migrate_interface_stats() how to bring existing tables up to date
+SCHEMA_VERSION = 3
+
+# Minimum time between partition maintenance runs
+MAINTENANCE_INTERVAL_HOURS = 12
+
+def _create_database_tables(config: Config) -> bool:
+    """Blocking implementation of create_database_tables()."""
     try:
         # Initialize connection pool first
         initialize_connection_pool(config)
         
         with db_connection(config) as connection:
             cursor = connection.cursor()
-            execute_with_retry(cursor, f"CREATE DATABASE IF NOT EXISTS {config.db_name}")
-            connection.commit()
-            
-            execute_with_retry(cursor, f"USE {config.db_name}")
-            
-            # Create routers table
-            execute_with_retry(cursor, """
-            CREATE TABLE IF NOT EXISTS routers (
-                router_id INT AUTO_INCREMENT,
-                ip_address VARCHAR(45) NOT NULL,
-                last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                sysName VARCHAR(255),
-                sysDescr TEXT,
-                sysUpTime BIGINT,
-                sysLocation VARCHAR(255),
-                sysContact VARCHAR(255),
-                sysObjectID VARCHAR(255),
-                PRIMARY KEY (router_id),
-                UNIQUE INDEX (ip_address),
-                INDEX (last_update)
-            ) ENGINE=InnoDB
-            """)
-            
-            # Create interfaces table
-            execute_with_retry(cursor, """
-            CREATE TABLE IF NOT EXISTS interfaces (
-                interface_id INT AUTO_INCREMENT,
-                router_id INT NOT NULL,
-                ifIndex BIGINT NOT NULL,
-                ifName VARCHAR(255),
-                ifDescr VARCHAR(255),
-                ifType VARCHAR(50),
-                ifMTU INT,
-                ifSpeed BIGINT,
-                ifPhysAddress VARCHAR(255),
-                ifHighSpeed BIGINT,
-                ifAlias VARCHAR(255),
-                ipAddresses TEXT,
-                last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                PRIMARY KEY (interface_id),
-                UNIQUE INDEX (router_id, ifIndex),
-                FOREIGN KEY (router_id) REFERENCES routers(router_id) ON DELETE CASCADE,
-                INDEX (last_update)
-            ) ENGINE=InnoDB
-            """)
             
-            # Check if interface_stats table exists
-            execute_with_retry(cursor, "SHOW TABLES LIKE 'interface_stats'")
-            table_exists = cursor.fetchone() is not None
-            
-            # Create interface_stats table with partitioning if needed
-            if not table_exists:
-                create_stats_table_query = """
-                CREATE TABLE interface_stats (
-                    stat_id INT AUTO_INCREMENT,
-                    interface_id INT NOT NULL,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    ifAdminStatus INT,
-                    ifOperStatus INT,
-                    ifInOctets BIGINT,
-                    ifOutOctets BIGINT,
-                    ifHCInOctets BIGINT,
-                    ifHCOutOctets BIGINT,
-                    PRIMARY KEY (stat_id),
-                    FOREIGN KEY (interface_id) REFERENCES interfaces(interface_id) ON DELETE CASCADE,
-                    INDEX (interface_id, timestamp),
-                    INDEX (timestamp)
-                ) ENGINE=InnoDB
-                """
-                
-                # Add partitioning if configured
-                if config.partition_interval_days > 0:
-                    create_stats_table_query += """
-                    PARTITION BY RANGE (TO_DAYS(timestamp)) (
-                        PARTITION p_default VALUES LESS THAN (TO_DAYS('2020-01-01'))
-                    )
-                    """
-                    
-                execute_with_retry(cursor, create_stats_table_query)
-                
-                # Create partitions for current and future periods if partitioning is enabled
-                if config.partition_interval_days > 0:
-                    create_time_partitions(cursor, config.partition_interval_days)
-                    
-                logger.info("Created interface_stats table" + 
-                           (" with time-based partitioning" if config.partition_interval_days > 0 else ""))
+            schema_meta = get_schema_meta(cursor)
+            if schema_meta is None or schema_meta[0] != SCHEMA_VERSION:
+                create_tables(cursor, config)
+                migrate_interface_stats(cursor, config)
+                execute_with_retry(
+                    cursor,
+                    "INSERT INTO schema_meta (id, version) VALUES (1, %s) "
+                    "ON DUPLICATE KEY UPDATE version = VALUES(version)",
+                    (SCHEMA_VERSION,)
+                )
+                maintenance_due = True
+            else:
+                logger.info("Database schema is up to date (version %d)", SCHEMA_VERSION)
+                maintenance_due = bool(schema_meta[1])
             
-            # Add a maintenance function to add new partitions as time progresses
-            if config.partition_interval_days > 0:
-                maintain_partitions(cursor, config.partition_interval_days)
+            # Add initial partitions to a new table, and new partitions as time progresses
+            if config.partition_interval_days > 0 and maintenance_due:
+                retention_days = config.stats_retention_days if config.drop_expired_partitions else 0
+                if maintain_partitions(cursor, config.partition_interval_days, retention_days):
+                    execute_with_retry(cursor, "UPDATE schema_meta SET last_maint = NOW() WHERE id = 1")
             
             connection.commit()
             logger.info("Database tables created or verified successfully.")
             return True
     except Error as e:
-        logger.error(f"Error creating database tables: {e}")
+        logger.error("Error creating database tables: %s", e)
         return False
 
-def create_time_partitions(cursor, interval_days: int, num_partitions: int = 6):
+async def create_database_tables(config: Config) -> bool:
+    """
+    Create the normalized database tables with time-based partitioning if configured.
+    
+    DDL is skipped when schema_meta already records SCHEMA_VERSION, and partition
+    maintenance runs at most once every MAINTENANCE_INTERVAL_HOURS. The DDL runs
+    in a worker thread so the event loop is not blocked.
+    """
+    return await asyncio.to_thread(_create_database_tables, config)
+
+def get_schema_meta(cursor) -> Optional[Tuple[int, int]]:
+    """
+    Read the recorded schema version and whether partition maintenance is due.
+    
+    Returns:
+        Optional[Tuple[int, int]]: (version, maintenance_due), or None if schema_meta is missing
+    """
+    try:
+        cursor.execute(
+            "SELECT version, last_maint IS NULL OR last_maint < NOW() - INTERVAL %s HOUR "
+            "FROM schema_meta WHERE id = 1",
+            (MAINTENANCE_INTERVAL_HOURS,)
+        )
+    except Error as e:
+        if e.errno == errorcode.ER_NO_SUCH_TABLE:
+            return None
+        raise
+    return cursor.fetchone()
+
+def create_tables(cursor, config: Config):
+    """Create the database and all tables, one statement at a time."""
+    stats_partitioning = ""
+    if config.partition_interval_days > 0:
+        stats_partitioning = """
+        PARTITION BY RANGE COLUMNS(timestamp) (
+            PARTITION p_default VALUES LESS THAN ('2020-01-01')
+        )
+        """
+    
+    # mysql-connector 9.2 removed execute(multi=True), so statements are sent separately
+    statements = [
+        f"CREATE DATABASE IF NOT EXISTS {config.db_name}",
+    
+        f"USE {config.db_name}",
+    
+        """
+        CREATE TABLE IF NOT EXISTS routers (
+            router_id INT AUTO_INCREMENT,
+            ip_address VARCHAR(45) NOT NULL,
+            last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            sysName VARCHAR(255),
+            sysDescr TEXT,
+            sysUpTime BIGINT,
+            sysLocation VARCHAR(255),
+            sysContact VARCHAR(255),
+            sysObjectID VARCHAR(255),
+            PRIMARY KEY (router_id),
+            UNIQUE INDEX (ip_address),
+            INDEX (last_update)
+        ) ENGINE=InnoDB
+        """,
+    
+        """
+        CREATE TABLE IF NOT EXISTS interfaces (
+            interface_id INT AUTO_INCREMENT,
+            router_id INT NOT NULL,
+            ifIndex BIGINT NOT NULL,
+            ifName VARCHAR(255),
+            ifDescr VARCHAR(255),
+            ifType VARCHAR(50),
+            ifMTU INT,
+            ifSpeed BIGINT,
+            ifPhysAddress VARCHAR(255),
+            ifHighSpeed BIGINT,
+            ifAlias VARCHAR(255),
+            ipAddresses TEXT,
+            last_update TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (interface_id),
+            UNIQUE INDEX (router_id, ifIndex),
+            FOREIGN KEY (router_id) REFERENCES routers(router_id) ON DELETE CASCADE,
+            INDEX (last_update)
+        ) ENGINE=InnoDB
+        """,
+    
+        """
+        CREATE TABLE IF NOT EXISTS schema_meta (
+            id TINYINT NOT NULL,
+            version INT NOT NULL,
+            last_maint DATETIME NULL,
+            PRIMARY KEY (id)
+        ) ENGINE=InnoDB
+        """,
+    
+        f"""
+        CREATE TABLE IF NOT EXISTS interface_stats (
+            stat_id INT AUTO_INCREMENT,
+            interface_id INT NOT NULL,
+            timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            ifAdminStatus INT,
+            ifOperStatus INT,
+            ifInOctets BIGINT,
+            ifOutOctets BIGINT,
+            ifHCInOctets BIGINT,
+            ifHCOutOctets BIGINT,
+            PRIMARY KEY (stat_id, timestamp),
+            INDEX (interface_id, timestamp),
+            INDEX (timestamp)
+        ) ENGINE=InnoDB
+        {stats_partitioning}
+        """,
+    ]
+    for statement in statements:
+        execute_with_retry(cursor, statement)
+
+def migrate_interface_stats(cursor, config: Config):
+    """
+    Bring an interface_stats table created by an older schema up to date.
+    
+    CREATE TABLE IF NOT EXISTS leaves existing tables untouched, so this drops the
+    foreign key to interfaces, converts timestamp to DATETIME, widens the primary
+    key to (stat_id, timestamp) and, if configured, partitions the table. Each step
+    is skipped when information_schema shows it is already done.
+    """
+    execute_with_retry(
+        cursor,
+        "SELECT CONSTRAINT_NAME FROM information_schema.TABLE_CONSTRAINTS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'interface_stats' "
+        "AND CONSTRAINT_TYPE = 'FOREIGN KEY'"
+    )
+    alterations = [f"DROP FOREIGN KEY `{name}`" for (name,) in cursor.fetchall()]
+    
+    execute_with_retry(
+        cursor,
+        "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'interface_stats' "
+        "AND COLUMN_NAME = 'timestamp'"
+    )
+    row = cursor.fetchone()
+    if row is not None and row[0].lower() != 'datetime':
+        alterations.append("MODIFY timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP")
+    
+    execute_with_retry(
+        cursor,
+        "SELECT COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'interface_stats' "
+        "AND CONSTRAINT_NAME = 'PRIMARY' ORDER BY ORDINAL_POSITION"
+    )
+    if [name for (name,) in cursor.fetchall()] == ['stat_id']:
+        alterations.extend(["DROP PRIMARY KEY", "ADD PRIMARY KEY (stat_id, timestamp)"])
+    
+    if alterations:
+        execute_with_retry(cursor, f"ALTER TABLE interface_stats {', '.join(alterations)}")
+        logger.info("Migrated interface_stats: %s", "; ".join(alterations))
+    
+    if config.partition_interval_days > 0 and not get_partitions(cursor):
+        # Existing rows all fall into p_default; dated partitions are added above it
+        bound = datetime.now().date() + timedelta(days=1)
+        execute_with_retry(
+            cursor,
+            "ALTER TABLE interface_stats PARTITION BY RANGE COLUMNS(timestamp) ("
+            f"PARTITION p_default VALUES LESS THAN ('{bound.isoformat()}'))"
+        )
+        logger.info("Partitioned existing interface_stats table by timestamp")
+
+def get_partitions(cursor) -> Dict[str, date]:
+    """
+    Get all interface_stats partitions in one information_schema query.
+    
+    Returns:
+        Dict[str, date]: Partition names mapped to their upper bound date
+    """
+    execute_with_retry(
+        cursor,
+        "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.partitions "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'interface_stats' "
+        "AND PARTITION_NAME IS NOT NULL"
+    )
+    # RANGE COLUMNS bounds are quoted literals such as '2024-01-01' or
+    # '2024-01-01 00:00:00'
+    return {
+        name: date.fromisoformat(description.strip("'")[:10])
+        for name, description in cursor.fetchall()
+        if description and description != 'MAXVALUE'
+    }
+
+def add_partitions(cursor, windows: List[Tuple[date, date]]):
+    """Add a partition for each (start, end) window with a single ALTER TABLE."""
+    partition_defs = ",\n".join(
+        f"PARTITION p_{start.strftime('%Y%m%d')} VALUES LESS THAN ('{end.isoformat()}')"
+        for start, end in windows
+    )
+    execute_with_retry(cursor, f"ALTER TABLE interface_stats ADD PARTITION (\n{partition_defs}\n)")
+    for start, end in windows:
+        logger.info("Added partition p_%s for date range %s to %s", start.strftime('%Y%m%d'), start, end)
+
+def create_time_partitions(cursor, interval_days: int, num_partitions: int = 6,
+                           existing: Optional[Dict[str, date]] = None):
     """Create time-based partitions for the interface_stats table."""
-    logger.info(f"Creating time-based partitions with {interval_days} day interval")
+    logger.info("Creating time-based partitions with %d day interval", interval_days)
+    
+    if existing is None:
+        existing = get_partitions(cursor)
+    # RANGE partitions can only be added above the current highest bound
+    highest = max(existing.values(), default=date.min)
     
     # Add partitions for current period and next few periods
     current_date = datetime.now().date()
-    for i in range(num_partitions):
-        partition_start = current_date + timedelta(days=i * interval_days)
-        partition_end = current_date + timedelta(days=(i + 1) * interval_days)
-        partition_name = f"p_{partition_start.strftime('%Y%m%d')}"
+    interval = timedelta(days=interval_days)
+    windows = [
+        (current_date + i * interval, current_date + (i + 1) * interval)
+        for i in range(num_partitions)
+    ]
+    windows = [
+        (start, end) for start, end in windows
+        if f"p_{start.strftime('%Y%m%d')}" not in existing and end > highest
+    ]
+    if len(windows) < num_partitions:
+        logger.debug("%d partitions already exist or are covered", num_partitions - len(windows))
+    
+    if windows:
+        add_partitions(cursor, windows)
+
+def drop_partitions_before(cursor, existing: Dict[str, date], cutoff: date) -> List[str]:
+    """
+    Drop the dated partitions whose whole range lies before a cutoff date.
+    
+    Args:
+        cursor: Database cursor
+        existing: Partition names mapped to their upper bound date
+        cutoff: Oldest date whose statistics must be kept
         
-        # Check if partition already exists before trying to create it
-        cursor.execute(
-            "SELECT PARTITION_NAME FROM information_schema.partitions "
-            "WHERE TABLE_NAME='interface_stats' AND PARTITION_NAME=%s",
-            (partition_name,)
-        )
-        if cursor.fetchone() is None:
-            add_partition_query = f"""
-            ALTER TABLE interface_stats ADD PARTITION (
-                PARTITION {partition_name} VALUES LESS THAN (TO_DAYS('{partition_end.strftime('%Y-%m-%d')}'))
-            )
-            """
-            execute_with_retry(cursor, add_partition_query)
-            logger.info(f"Added partition {partition_name} for date range {partition_start} to {partition_end}")
-        else:
-            logger.debug(f"Partition {partition_name} already exists")
+    Returns:
+        List[str]: Names of the dropped partitions
+    """
+    expired = [
+        name for name, bound in existing.items()
+        if name != 'p_default' and bound <= cutoff
+    ]
+    if expired:
+        execute_with_retry(cursor, f"ALTER TABLE interface_stats DROP PARTITION {', '.join(expired)}")
+        logger.info("Dropped %d interface_stats partitions older than %s", len(expired), cutoff)
+    return expired
 
-def maintain_partitions(cursor, interval_days: int):
-    """Check and add new partitions if needed."""
+def purge_default_partition(cursor, cutoff: date) -> int:
+    """
+    Delete rows older than a cutoff date from the p_default partition.
+    
+    p_default is never dropped, and a migrated table keeps all of its older rows
+    there, so they have to be expired row by row.
+    
+    Args:
+        cursor: Database cursor
+        cutoff: Oldest date whose statistics must be kept
+        
+    Returns:
+        int: Number of deleted rows
+    """
+    execute_with_retry(
+        cursor,
+        "DELETE FROM interface_stats PARTITION (p_default) WHERE timestamp < %s",
+        (cutoff,)
+    )
+    deleted = cursor.rowcount
+    if deleted:
+        logger.info("Deleted %d interface_stats rows older than %s from p_default", deleted, cutoff)
+    return deleted
+
+def maintain_partitions(cursor, interval_days: int, retention_days: int = 0) -> bool:
+    """
+    Check and add new partitions if needed, returning True on success.
+    
+    When retention_days is positive, partitions entirely older than the retention
+    window are dropped in the same maintenance run, and expired rows are deleted
+    from p_default.
+    """
     try:
         # Get current partition information
-        cursor.execute(
-            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.partitions "
-            "WHERE TABLE_NAME='interface_stats' AND PARTITION_NAME != 'p_default' "
-            "ORDER BY PARTITION_DESCRIPTION DESC LIMIT 1"
-        )
-        result = cursor.fetchone()
+        existing = get_partitions(cursor)
+        if retention_days > 0:
+            cutoff = datetime.now().date() - timedelta(days=retention_days)
+            for name in drop_partitions_before(cursor, existing, cutoff):
+                del existing[name]
+            if 'p_default' in existing:
+                purge_default_partition(cursor, cutoff)
+        bounds = [bound for name, bound in existing.items() if name != 'p_default']
         
-        if result and result[1]:
-            partition_name, partition_desc = result
-            
-            # Convert PARTITION_DESCRIPTION (which contains TO_DAYS value) back to date
-            cursor.execute(f"SELECT FROM_DAYS({partition_desc})")
-            last_partition_date_str = cursor.fetchone()[0]
-            last_partition_date = datetime.strptime(last_partition_date_str, '%Y-%m-%d').date()
+        if bounds:
+            last_partition_date = max(bounds)
             
             # Get the current date and calculate how many days ahead we have partitions for
             current_date = datetime.now().date()
@@ -171,27 +353,13 @@ def maintain_partitions(cursor, interval_days: int):
             
             # If we have less than 3 intervals of partitions ahead, add a new one
             if days_ahead < interval_days * 3:
-                # Add one more partition
                 new_partition_start = last_partition_date
                 new_partition_end = new_partition_start + timedelta(days=interval_days)
-                new_partition_name = f"p_{new_partition_start.strftime('%Y%m%d')}"
-                
-                # Make sure the partition doesn't already exist to avoid errors
-                cursor.execute(
-                    "SELECT PARTITION_NAME FROM information_schema.partitions "
-                    "WHERE TABLE_NAME='interface_stats' AND PARTITION_NAME=%s",
-                    (new_partition_name,)
-                )
-                if cursor.fetchone() is None:
-                    add_partition_query = f"""
-                    ALTER TABLE interface_stats ADD PARTITION (
-                        PARTITION {new_partition_name} VALUES LESS THAN (TO_DAYS('{new_partition_end.strftime('%Y-%m-%d')}'))
-                    )
-                    """
-                    execute_with_retry(cursor, add_partition_query)
-                    logger.info(f"Added new partition {new_partition_name} for date range {new_partition_start} to {new_partition_end}")
+                add_partitions(cursor, [(new_partition_start, new_partition_end)])
         else:
             logger.warning("No existing partitions found. Creating initial partitions.")
-            create_time_partitions(cursor, interval_days)
+            create_time_partitions(cursor, interval_days, existing=existing)
+        return True
     except Error as e:
-        logger.error(f"Error maintaining partitions: {e}")
\ No newline at end of file
+        logger.error("Error maintaining partitions: %s", e)
+        return False
\ No newline at end of file
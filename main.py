@@ -8,65 +8,98 @@ import os
 import sys
 import asyncio
 import argparse
+import dataclasses
+import concurrent.futures
 import time
+from pathlib import Path
+import re
 import ipaddress
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .config import load_config, Config
 from .db.schema import create_database_tables
 from .db.router_dao import save_failed_routers
+from .db.interface_dao import stats_writer, stop_stats_writer
 from snmp.client import check_snmp_tools_installed
 from .models.router import process_router
 from .util.logging import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Dotted-quad IPv4 address without leading zeros
+IPV4_RE = re.compile(r'(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)')
+
+def _normalize_ip_address(value: str) -> Optional[str]:
+    """Return the canonical form of an IPv4 or IPv6 address, or None if it is invalid."""
+    # Dotted quads without leading zeros are already canonical
+    if IPV4_RE.fullmatch(value):
+        return value
+    # Only IPv6 candidates are handed to ipaddress, which compresses them
+    if ':' not in value:
+        return None
+    try:
+        return str(ipaddress.ip_address(value))
+    except ValueError:
+        return None
+
 def read_router_ips(filename: str) -> List[str]:
     """Read router IP addresses from a file."""
     router_ips = []
     try:
-        with open(filename, 'r') as file:
-            for line in file:
-                # Remove comments and strip whitespace
-                line = line.split('#')[0].strip()
-                if not line:
-                    continue
-                
-                try:
-                    # Validate IP address
-                    ip = ipaddress.ip_address(line)
-                    router_ips.append(str(ip))
-                except ValueError:
-                    logger.warning(f"Invalid IP address in {filename}: {line}")
+        lines = Path(filename).read_text().splitlines()
     except FileNotFoundError:
         logger.error(f"Router file not found: {filename}")
-    
+        return router_ips
+
+    for line in lines:
+        # Remove comments and strip whitespace
+        line = line.split('#')[0].strip()
+        if not line:
+            continue
+
+        ip = _normalize_ip_address(line)
+        if ip is not None:
+            router_ips.append(ip)
+        else:
+            logger.warning(f"Invalid IP address in {filename}: {line}")
+
     return router_ips
 
 async def process_routers(router_ips: List[str], config: Config) -> Tuple[int, int]:
     """Process all routers with concurrency control."""
     logger.info(f"Processing {len(router_ips)} routers with max concurrency {config.max_concurrent_routers}")
     
-    # Use semaphore to limit concurrency
-    semaphore = asyncio.Semaphore(config.max_concurrent_routers)
-    failed_routers = []
-    successful_count = 0
-    
-    async def process_router_with_semaphore(router_ip):
-        nonlocal successful_count
-        async with semaphore:
-            success = await process_router(router_ip, config)
-            if success:
-                successful_count += 1
+    # Fixed pool of workers pulling from a queue bounds concurrency
+    queue = asyncio.Queue()
+    for router_ip in router_ips:
+        queue.put_nowait(router_ip)
+    
+    async def worker() -> Tuple[List[str], List[str]]:
+        successful, failed = [], []
+        while not queue.empty():
+            router_ip = queue.get_nowait()
+            if await process_router(router_ip, config):
+                successful.append(router_ip)
             else:
-                failed_routers.append(router_ip)
+                failed.append(router_ip)
+        return successful, failed
     
-    # Create tasks for all routers
-    tasks = [process_router_with_semaphore(ip) for ip in router_ips]
+    # Each worker returns its own results; merge them once all are done
+    async with asyncio.TaskGroup() as task_group:
+        tasks = [
+            task_group.create_task(worker())
+            for _ in range(min(config.max_concurrent_routers, len(router_ips)))
+        ]
+    results = [task.result() for task in tasks]
     
-    # Wait for all tasks to complete
-    await asyncio.gather(*tasks)
+    successful_count = sum(len(successful) for successful, _ in results)
+    failed_routers = [router_ip for _, failed in results for router_ip in failed]
     
     # Save failed routers to file
     if failed_routers:
@@ -103,24 +136,38 @@ async def main():
     config = load_config()
     
     # Override config with command line arguments if provided
+    overrides = {}
     if args.community:
-        config.community = args.community
+        overrides['community'] = args.community
     if args.port:
-        config.port = args.port
+        overrides['port'] = args.port
     if args.timeout:
-        config.timeout = args.timeout
+        overrides['timeout'] = args.timeout
     if args.retries:
-        config.retries = args.retries
+        overrides['retries'] = args.retries
     if args.max_concurrent:
-        config.max_concurrent_routers = args.max_concurrent
-    
-    # Check for SNMP tools
-    if not await check_snmp_tools_installed():
+        overrides['max_concurrent_routers'] = args.max_concurrent
+    if overrides:
+        config = dataclasses.replace(config, **overrides)
+    
+    # Blocking DAO calls run in the default executor; match its size to the
+    # connection pool so threads don't queue up waiting for connections
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=config.db_pool_max_size)
+    )
+    
+    # Check for SNMP tools, set up the database (which also opens the connection
+    # pool) and read router IPs concurrently
+    startup = [check_snmp_tools_installed(), create_database_tables(config)]
+    if not args.db_setup:
+        startup.append(asyncio.to_thread(read_router_ips, args.routers))
+    tools_installed, tables_ready, *read_results = await asyncio.gather(*startup)
+    
+    if not tools_installed:
         logger.error("SNMP tools (net-snmp) not installed. Please install them and try again.")
         sys.exit(1)
     
-    # Set up database
-    if not await create_database_tables(config):
+    if not tables_ready:
         logger.error("Failed to set up database tables")
         sys.exit(1)
     
@@ -129,21 +176,30 @@ async def main():
         logger.info("Database setup complete")
         return
     
-    # Read router IPs
-    router_ips = read_router_ips(args.routers)
+    router_ips = read_results[0]
     if not router_ips:
         logger.error(f"No valid router IP addresses found in {args.routers}")
         sys.exit(1)
     
     logger.info(f"Found {len(router_ips)} router IP addresses to process")
     
-    # Process routers
+    # Process routers; queued interface statistics are written in shared
+    # cross-router batches and flushed before the run is reported
     start_time = time.time()
-    successful, failed = await process_routers(router_ips, config)
+    writer = asyncio.create_task(stats_writer(config))
+    try:
+        successful, failed = await process_routers(router_ips, config)
+    finally:
+        stop_stats_writer()
+        await writer
     end_time = time.time()
     
     logger.info(f"Processed {len(router_ips)} routers in {end_time - start_time:.2f} seconds")
     logger.info(f"Successful: {successful}, Failed: {failed}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Prefer the libuv event loop when uvloop is installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
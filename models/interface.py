@@ -2,8 +2,14 @@ from dataclasses import dataclass
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+# SNMP keys in Interface field order, for positional construction
+_DESCRIPTION_KEYS = ('ifName', 'ifDescr', 'ifMTU', 'ifSpeed', 'ifPhysAddress',
+                     'ifHighSpeed', 'ifAlias', 'ipAddresses')
+_STATS_KEYS = ('ifAdminStatus', 'ifOperStatus', 'ifInOctets', 'ifOutOctets',
+               'ifHCInOctets', 'ifHCOutOctets')
 
-@dataclass
+
+@dataclass(slots=True)
 class Interface:
     """Interface model representing a network interface on a router."""
     if_index: str
@@ -29,23 +35,17 @@ class Interface:
     @classmethod
     def from_snmp_data(cls, if_index: str, data: Dict[str, Any]) -> 'Interface':
         """Create an Interface instance from SNMP data."""
+        get = data.get
+        # Positional order follows the dataclass fields; router_id,
+        # interface_id and last_update are filled in later
         return cls(
-            if_index=if_index,
-            if_type=data.get('ifType', ''),
-            if_name=data.get('ifName'),
-            if_descr=data.get('ifDescr'),
-            if_mtu=data.get('ifMTU'),
-            if_speed=data.get('ifSpeed'),
-            if_phys_address=data.get('ifPhysAddress'),
-            if_high_speed=data.get('ifHighSpeed'),
-            if_alias=data.get('ifAlias'),
-            ip_addresses=data.get('ipAddresses'),
-            if_admin_status=data.get('ifAdminStatus'),
-            if_oper_status=data.get('ifOperStatus'),
-            if_in_octets=data.get('ifInOctets'),
-            if_out_octets=data.get('ifOutOctets'),
-            if_hc_in_octets=data.get('ifHCInOctets'),
-            if_hc_out_octets=data.get('ifHCOutOctets')
+            if_index,
+            get('ifType', ''),
+            None,
+            *[get(key) for key in _DESCRIPTION_KEYS],
+            None,
+            None,
+            *[get(key) for key in _STATS_KEYS]
         )
 
     def to_db_dict(self) -> Dict[str, Any]:
@@ -85,19 +85,18 @@ class InterfaceBatch:
     
     def get_stats_batch_values(self, timestamp: str) -> List[tuple]:
         """Get values for batch statistics insertion."""
-        values = []
-        for interface in self.interfaces:
-            if not interface.interface_id:
-                continue
-                
-            values.append((
+        # Counters are already ints from the SNMP parser; only map missing values to 0
+        return [
+            (
                 interface.interface_id,
                 timestamp,
-                int(interface.if_admin_status or 0),
-                int(interface.if_oper_status or 0),
-                int(interface.if_in_octets or 0),
-                int(interface.if_out_octets or 0),
-                int(interface.if_hc_in_octets or 0),
-                int(interface.if_hc_out_octets or 0)
-            ))
-        return values
\ No newline at end of file
+                interface.if_admin_status or 0,
+                interface.if_oper_status or 0,
+                interface.if_in_octets or 0,
+                interface.if_out_octets or 0,
+                interface.if_hc_in_octets or 0,
+                interface.if_hc_out_octets or 0
+            )
+            for interface in self.interfaces
+            if interface.interface_id
+        ]
\ No newline at end of file
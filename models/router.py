@@ -3,7 +3,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Router:
     """Router model representing a network device."""
     ip_address: str
@@ -4,13 +4,14 @@ This package provides functionality for SNMP operations, parsing responses,
 and defining SNMP constants.
 """
 
-from .client import check_snmp_tools_installed, snmp_get, snmp_walk
+from .client import check_snmp_tools_installed, snmp_get, snmp_get_multi, snmp_walk
 from .constants import OID_CONSTANTS
 from .parsers import parse_snmp_value
 
 __all__ = [
     'check_snmp_tools_installed',
     'snmp_get',
+    'snmp_get_multi',
     'snmp_walk',
     'OID_CONSTANTS',
     'parse_snmp_value'
@@ -5,13 +5,45 @@ SNMP client for executing snmpget and snmpwalk commands.
 
 import asyncio
 import logging
-from typing import Dict, Optional, Any, List
+import math
+import time
+from typing import Dict, Optional, Any, List, Tuple
 
-from .parsers import parse_snmp_value, parse_snmp_walk_response
+from .constants import IF_ATTR_OIDS, OID_CONSTANTS, SYS_OIDS
+from .parsers import parse_snmp_get_response, parse_snmp_value, parse_snmp_walk_line
+from .ratelimit import TokenBucket, get_bucket
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# net-snmp output flags: single GETs print only the typed value ("TYPE: value"),
+# multi-OID GETs print numeric OIDs so lines can be matched to the request
+SNMP_GET_OUTPUT_FLAGS = "-Ov"
+SNMP_GET_MULTI_OUTPUT_FLAGS = "-On"
+
+# Walks print numeric OIDs; only the last component is used as the index
+SNMP_WALK_OUTPUT_FLAGS = "-On"
+
+# Skip loading MIB files; output is numeric so no MIB translation is needed
+SNMP_MIB_FLAGS = ["-m", ""]
+
+# Maximum number of concurrent walks against one router
+MAX_PARALLEL_WALKS = 4
+
+# Default GETBULK max-repetitions for walks
+DEFAULT_MAX_REPETITIONS = 50
+
+# Seconds a router's discovered interface indices are reused before re-walking.
+# The cache only pays off when one process polls a router repeatedly; main()
+# polls each router once per run, so there every poll walks
+OID_CACHE_TTL = 3600
+
+# Number of OIDs requested per snmpget when polling cached interfaces
+OID_BATCH_SIZE = 32
+
+# Per-router cache of (expiry time, monitored (ifIndex, ifType, raw ifType) tuples)
+_oid_cache: Dict[str, Tuple[float, List[Tuple[str, int, Any]]]] = {}
+
 
 async def check_snmp_tools_installed() -> bool:
     """
@@ -33,7 +65,20 @@ async def check_snmp_tools_installed() -> bool:
         return False
 
 
-async def snmp_get(target: str, oid: str, community: str, port: int, timeout: int, retries: int) -> Optional[Any]:
+def _stderr_target(capture_errors: bool) -> int:
+    """Pipe a command's stderr when its errors are wanted, otherwise discard it."""
+    return asyncio.subprocess.PIPE if capture_errors else asyncio.subprocess.DEVNULL
+
+
+def _error_text(returncode: int, stderr: Optional[bytes]) -> str:
+    """Describe a failed net-snmp command; stderr is only decoded here, on failure."""
+    if stderr is None:
+        return f"exit status {returncode}"
+    return stderr.decode().strip()
+
+
+async def snmp_get(target: str, oid: str, community: str, port: int, timeout: int, retries: int,
+                   capture_errors: bool = True) -> Optional[Any]:
     """
     Perform SNMP GET operation for a single OID using snmpget command.
     
@@ -44,12 +89,14 @@ async def snmp_get(target: str, oid: str, community: str, port: int, timeout: in
         port: SNMP port
         timeout: Timeout in seconds
         retries: Number of retries
+        capture_errors: Read snmpget's stderr for the warning on failure; if False
+            stderr is discarded and only the exit status is logged
     
     Returns:
         Optional[Any]: Parsed value or None if error occurred
     """
     cmd = [
-        "snmpget", "-v2c", 
+        "snmpget", "-v2c", *SNMP_MIB_FLAGS, SNMP_GET_OUTPUT_FLAGS,
         "-c", community,
         "-r", str(retries),
         "-t", str(timeout),
@@ -62,12 +109,12 @@ async def snmp_get(target: str, oid: str, community: str, port: int, timeout: in
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=_stderr_target(capture_errors)
         )
         stdout, stderr = await proc.communicate()
         
         if proc.returncode != 0:
-            error = stderr.decode().strip()
+            error = _error_text(proc.returncode, stderr)
             logger.warning(f"SNMP error for {target} OID {oid}: {error}")
             return None
         
@@ -76,24 +123,66 @@ async def snmp_get(target: str, oid: str, community: str, port: int, timeout: in
             logger.warning(f"OID {oid} not found on {target}")
             return None
         
-        # Extract the actual value using a regex to handle all cases
-        import re
-        match = re.search(r'=\s*(.+)$', output)
-        if match:
-            value_str = match.group(1).strip()
-            return parse_snmp_value(value_str)
-        
-        logger.warning(f"Could not parse SNMP response: {output}")
-        return output  # Return raw output if parsing failed
+        return parse_snmp_value(output)
         
     except Exception as e:
         logger.warning(f"Error executing snmpget for {target} OID {oid}: {e}")
         return None
 
 
-async def snmp_walk(target: str, oid: str, community: str, port: int, timeout: int, retries: int) -> Dict[str, Any]:
+async def snmp_get_multi(target: str, oids: List[str], community: str, port: int, timeout: int,
+                         retries: int, capture_errors: bool = True) -> Dict[str, Any]:
+    """
+    Perform one SNMP GET for several OIDs using a single snmpget command.
+    
+    Args:
+        target: Target IP address
+        oids: Numeric OIDs to query
+        community: SNMP community string
+        port: SNMP port
+        timeout: Timeout in seconds
+        retries: Number of retries
+        capture_errors: Read snmpget's stderr for the warning on failure; if False
+            stderr is discarded and only the exit status is logged
+    
+    Returns:
+        Dict[str, Any]: Parsed values keyed by OID; OIDs missing on the agent map
+        to None, and an empty dict is returned if the request failed
+    """
+    cmd = [
+        "snmpget", "-v2c", *SNMP_MIB_FLAGS, SNMP_GET_MULTI_OUTPUT_FLAGS,
+        "-c", community,
+        "-r", str(retries),
+        "-t", str(timeout),
+        f"{target}:{port}",
+        *oids
+    ]
+    
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=_stderr_target(capture_errors)
+        )
+        stdout, stderr = await proc.communicate()
+        
+        if proc.returncode != 0:
+            error = _error_text(proc.returncode, stderr)
+            logger.warning(f"SNMP error for {target} OIDs {', '.join(oids)}: {error}")
+            return {}
+        
+        return parse_snmp_get_response(stdout.decode())
+        
+    except Exception as e:
+        logger.warning(f"Error executing snmpget for {target} OIDs {', '.join(oids)}: {e}")
+        return {}
+
+
+async def snmp_walk(target: str, oid: str, community: str, port: int, timeout: int, retries: int,
+                    max_repetitions: int = DEFAULT_MAX_REPETITIONS, capture_errors: bool = True,
+                    full_index: bool = False) -> Dict[str, Any]:
     """
-    Perform SNMP WALK operation using snmpwalk command.
+    Perform SNMP WALK operation using snmpbulkwalk (GETBULK) command.
     
     Args:
         target: Target IP address
@@ -102,12 +191,18 @@ async def snmp_walk(target: str, oid: str, community: str, port: int, timeout: i
         port: SNMP port
         timeout: Timeout in seconds
         retries: Number of retries
+        max_repetitions: Varbinds requested per GETBULK round-trip
+        capture_errors: Read snmpbulkwalk's stderr for the warning on failure; if False
+            stderr is discarded and only the exit status is logged
+        full_index: Key results by the whole OID below oid rather than its last
+            component, e.g. when walking a table entry or a multi-part index
     
     Returns:
         Dict[str, Any]: Dictionary with OID indices as keys and parsed values
     """
     cmd = [
-        "snmpwalk", "-v2c",
+        "snmpbulkwalk", "-v2c", *SNMP_MIB_FLAGS, SNMP_WALK_OUTPUT_FLAGS,
+        f"-Cr{max_repetitions}",
         "-c", community,
         "-r", str(retries),
         "-t", str(timeout),
@@ -116,29 +211,121 @@ async def snmp_walk(target: str, oid: str, community: str, port: int, timeout: i
     ]
     
     try:
-        # Run the snmpwalk command asynchronously
+        # Run the snmpbulkwalk command asynchronously
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=_stderr_target(capture_errors)
         )
-        stdout, stderr = await proc.communicate()
+        # Drain stderr alongside stdout so a chatty agent can't fill the pipe
+        stderr_task = asyncio.ensure_future(proc.stderr.read()) if capture_errors else None
+        
+        try:
+            # Parse varbinds as net-snmp prints them instead of buffering the whole table
+            result = {}
+            base_oid = oid if full_index else None
+            async for line_bytes in proc.stdout:
+                parsed = parse_snmp_walk_line(line_bytes, base_oid)
+                if parsed is not None:
+                    index, value = parsed
+                    result[index] = value
+            
+            stderr = await stderr_task if stderr_task is not None else None
+            await proc.wait()
+        finally:
+            # If parsing failed or we were cancelled, don't leave the walk running or unreaped
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+            if stderr_task is not None and not stderr_task.done():
+                stderr_task.cancel()
         
         if proc.returncode != 0:
-            error = stderr.decode().strip()
+            error = _error_text(proc.returncode, stderr)
             logger.warning(f"SNMP walk error for {target} OID {oid}: {error}")
             return {}
         
-        output = stdout.decode().strip()
-        return parse_snmp_walk_response(output)
+        return result
         
     except Exception as e:
-        logger.warning(f"Error executing snmpwalk for {target} OID {oid}: {e}")
+        logger.warning(f"Error executing snmpbulkwalk for {target} OID {oid}: {e}")
         return {}
 
 
+def _router_bucket(router_ip: str, request_interval: float) -> TokenBucket:
+    """Get the router's token bucket, allowing a burst of MAX_PARALLEL_WALKS requests."""
+    return get_bucket(router_ip, request_interval, MAX_PARALLEL_WALKS)
+
+
+async def _paced_walk(bucket: TokenBucket, target: str, oid: str, community: str, port: int,
+                      timeout: int, retries: int, capture_errors: bool = False) -> Dict[str, Any]:
+    """Run snmp_walk() once the router's bucket allows it."""
+    await bucket.acquire()  # Rate limiting
+    return await snmp_walk(target, oid, community, port, timeout, retries, capture_errors=capture_errors)
+
+
+async def _bounded_walk(sem: asyncio.Semaphore, bucket: TokenBucket, target: str, oid: str, community: str,
+                        port: int, timeout: int, retries: int, capture_errors: bool = False) -> Dict[str, Any]:
+    """Run snmp_walk() while holding a slot of sem, once the router's bucket allows it."""
+    async with sem:
+        return await _paced_walk(bucket, target, oid, community, port, timeout, retries, capture_errors)
+
+
+async def _bounded_get_multi(sem: asyncio.Semaphore, bucket: TokenBucket, target: str, oids: List[str],
+                             community: str, port: int, timeout: int, retries: int,
+                             capture_errors: bool = False) -> Dict[str, Any]:
+    """Run snmp_get_multi() while holding a slot of sem, once the router's bucket allows it."""
+    async with sem:
+        await bucket.acquire()  # Rate limiting
+        return await snmp_get_multi(target, oids, community, port, timeout, retries, capture_errors)
+
+
+async def _walk_interface_attributes(router_ip: str, attr_oids: Dict[str, str], community: str,
+                                     port: int, timeout: int, retries: int,
+                                     bucket: TokenBucket, capture_errors: bool = False) -> List[Dict[str, Any]]:
+    """Walk each attribute OID, returning one ifIndex -> value dict per OID."""
+    sem = asyncio.Semaphore(MAX_PARALLEL_WALKS)
+    return await asyncio.gather(*[
+        _bounded_walk(sem, bucket, router_ip, oid, community, port, timeout, retries, capture_errors)
+        for oid in attr_oids.values()
+    ])
+
+
+async def _get_interface_attributes(router_ip: str, attr_oids: Dict[str, str], indices: List[str],
+                                    community: str, port: int, timeout: int, retries: int,
+                                    bucket: TokenBucket,
+                                    batch_size: int, capture_errors: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get attribute values for known interface indices with batched multi-OID GETs.
+    
+    Returns:
+        Optional[List[Dict[str, Any]]]: One ifIndex -> value dict per attribute OID,
+        or None if any request failed
+    """
+    oids = [f"{oid}.{index}" for oid in attr_oids.values() for index in indices]
+    sem = asyncio.Semaphore(MAX_PARALLEL_WALKS)
+    batches = await asyncio.gather(*[
+        _bounded_get_multi(sem, bucket, router_ip, oids[start:start + batch_size], community, port,
+                           timeout, retries, capture_errors)
+        for start in range(0, len(oids), batch_size)
+    ])
+    if not all(batches):
+        return None
+    
+    values = {}
+    for batch in batches:
+        values.update(batch)
+    return [
+        {index: values.get(f"{oid}.{index}") for index in indices}
+        for oid in attr_oids.values()
+    ]
+
+
 async def get_device_info(router_ip: str, community: str, port: int, timeout: int, retries: int, 
-                         request_interval: float) -> Dict[str, Any]:
+                         request_interval: float, capture_errors: bool = False) -> Dict[str, Any]:
     """
     Get device (router) information based on system OIDs.
     
@@ -149,24 +336,25 @@ async def get_device_info(router_ip: str, community: str, port: int, timeout: in
         timeout: Timeout in seconds
         retries: Number of retries
         request_interval: Interval between requests to the same router
+        capture_errors: Log net-snmp's error text on failure instead of only its exit status
         
     Returns:
         Dict[str, Any]: Dictionary with router information
     """
-    from .constants import OID_CONSTANTS
+    # Only get system info, not interface info, in a single request
+    await _router_bucket(router_ip, request_interval).acquire()  # Rate limiting
+    values = await snmp_get_multi(router_ip, list(SYS_OIDS.values()), community, port, timeout, retries,
+                                  capture_errors)
     
     device_info = {"ip_address": router_ip}
-    for name, oid in OID_CONSTANTS.items():
-        if name.startswith("sys"):  # Only get system info, not interface info
-            value = await snmp_get(router_ip, oid, community, port, timeout, retries)
-            device_info[name] = value if value is not None else "Error retrieving value"
-            # Rate limiting
-            await asyncio.sleep(request_interval)
+    for name, oid in SYS_OIDS.items():
+        value = values.get(oid)
+        device_info[name] = value if value is not None else "Error retrieving value"
     return device_info
 
 
 async def get_ip_to_interface_mapping(router_ip: str, community: str, port: int, timeout: int, retries: int,
-                                    request_interval: float) -> Dict[str, List[str]]:
+                                    request_interval: float, capture_errors: bool = False) -> Dict[str, List[str]]:
     """
     Get mapping between IP addresses and interface indices.
     
@@ -177,32 +365,56 @@ async def get_ip_to_interface_mapping(router_ip: str, community: str, port: int,
         timeout: Timeout in seconds
         retries: Number of retries
         request_interval: Interval between requests to the same router
+        capture_errors: Log net-snmp's error text on failure instead of only its exit status
         
     Returns:
         Dict[str, List[str]]: Dictionary with interface indices as keys and lists of IP addresses as values
     """
-    from .constants import OID_CONSTANTS
+    await _router_bucket(router_ip, request_interval).acquire()  # Rate limiting
+    # Walk the whole ipAddrEntry once; rows are keyed "<column>.<IP address>"
+    entries = await snmp_walk(router_ip, OID_CONSTANTS["ipAddrEntry"], community, port, timeout, retries,
+                              capture_errors=capture_errors, full_index=True)
     
-    mapping = {}
-    ip_addresses = await snmp_walk(router_ip, OID_CONSTANTS["ipAddress"], community, port, timeout, retries)
-    await asyncio.sleep(request_interval)  # Rate limiting
+    mapping: Dict[str, List[str]] = {}
+    ip_addresses: Dict[str, Any] = {}
+    ip_to_if_indices: Dict[str, Any] = {}
+    for key, value in entries.items():
+        column, _, ip_index = key.partition('.')
+        if column == "1":  # ipAdEntAddr
+            ip_addresses[ip_index] = value
+        elif column == "2":  # ipAdEntIfIndex
+            ip_to_if_indices[ip_index] = value
     
-    ip_to_if_indices = await snmp_walk(router_ip, OID_CONSTANTS["ipAdEntIfIndex"], community, port, timeout, retries)
-    await asyncio.sleep(request_interval)  # Rate limiting
-
-    for idx in ip_addresses:
-        if idx in ip_to_if_indices:
-            if_idx = str(ip_to_if_indices[idx])
-            mapping.setdefault(if_idx, []).append(str(ip_addresses[idx]))
+    get_if_idx = ip_to_if_indices.get
+    for idx, ip in ip_addresses.items():
+        if_idx = get_if_idx(idx)
+        if if_idx is None:
+            continue
+        if_idx = str(if_idx)
+        # Parser guarantees str for IpAddress
+        addresses = mapping.get(if_idx)
+        if addresses is None:
+            mapping[if_idx] = [ip]
+        else:
+            addresses.append(ip)
     
     return mapping
 
 
 async def get_monitored_interfaces(router_ip: str, community: str, port: int, timeout: int, retries: int,
-                                 request_interval: float) -> Dict[str, Dict[str, Any]]:
+                                 request_interval: float, refresh_oids_cache_interval: float = OID_CACHE_TTL,
+                                 oid_batch_size: int = OID_BATCH_SIZE,
+                                 capture_errors: bool = False) -> Dict[str, Dict[str, Any]]:
     """
     Get interfaces to monitor based on the specified interface types.
     
+    The first poll walks the interface tables and caches the monitored indices.
+    Polls within refresh_oids_cache_interval skip the ifType walk, and fetch the
+    cached interfaces' OIDs with batched multi-OID GETs when that takes fewer
+    requests than walking each attribute table, falling back to walking on error.
+    The cache only helps callers that poll the same router more than once per
+    process, such as a long-running poller.
+    
     Args:
         router_ip: IP address of the router
         community: SNMP community string
@@ -210,51 +422,74 @@ async def get_monitored_interfaces(router_ip: str, community: str, port: int, ti
         timeout: Timeout in seconds
         retries: Number of retries
         request_interval: Interval between requests to the same router
+        refresh_oids_cache_interval: Seconds to reuse discovered interface indices
+        oid_batch_size: Number of OIDs per snmpget when polling cached interfaces
+        capture_errors: Log net-snmp's error text on failure instead of only its exit status
         
     Returns:
         Dict[str, Dict[str, Any]]: Dictionary with interface indices as keys and interface data as values
     """
-    from .constants import OID_CONSTANTS
+    # Imported here: snmp is also loaded as a top-level package, where ..models is out of reach
     from ..models.interface import INTERFACE_TYPES_TO_MONITOR
     
-    if_types = await snmp_walk(router_ip, OID_CONSTANTS["ifType"], community, port, timeout, retries)
-    await asyncio.sleep(request_interval)  # Rate limiting
-    
-    if not if_types:
-        logger.warning(f"No interface types found for router {router_ip}")
-        return {}
+    bucket = _router_bucket(router_ip, request_interval)
+    cached = _oid_cache.get(router_ip)
+    use_cache = cached is not None and cached[0] > time.monotonic()
+    if use_cache:
+        monitored = cached[1]
+    else:
+        await bucket.acquire()  # Rate limiting
+        if_types = await snmp_walk(router_ip, OID_CONSTANTS["ifType"], community, port, timeout, retries,
+                                   capture_errors=capture_errors)
+        
+        if not if_types:
+            logger.warning(f"No interface types found for router {router_ip}")
+            return {}
+        
+        monitored = []
+        for index, if_type in if_types.items():
+            try:
+                if_type_int = int(if_type)
+                if if_type_int in INTERFACE_TYPES_TO_MONITOR:
+                    monitored.append((index, if_type_int, if_type))
+                    logger.debug("Found interface type %d (%s) on index %s", if_type_int, INTERFACE_TYPES_TO_MONITOR[if_type_int], index)
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid interface type value for index {index}: {if_type}")
     
-    monitored_indices = []
-    for index, if_type in if_types.items():
-        try:
-            if_type_int = int(if_type)
-            if if_type_int in INTERFACE_TYPES_TO_MONITOR:
-                monitored_indices.append(index)
-                logger.debug(f"Found interface type {if_type_int} ({INTERFACE_TYPES_TO_MONITOR[if_type_int]}) on index {index}")
-        except (ValueError, TypeError):
-            logger.warning(f"Invalid interface type value for index {index}: {if_type}")
-
-    if not monitored_indices:
-        logger.info(f"No monitored interface types found for router {router_ip}")
-        return {}
+        if not monitored:
+            logger.info(f"No monitored interface types found for router {router_ip}")
+            return {}
+        
+        _oid_cache[router_ip] = (time.monotonic() + refresh_oids_cache_interval, monitored)
     
-    logger.info(f"Found {len(monitored_indices)} monitored interfaces for router {router_ip}")
+    logger.info(f"Found {len(monitored)} monitored interfaces for router {router_ip}")
     
     interfaces = {
-        index: {
-            "ifIndex": index, 
-            "ifType": f"{if_types[index]} ({INTERFACE_TYPES_TO_MONITOR.get(int(if_types[index]), 'Unknown')})"
-        } for index in monitored_indices
+        index: {"ifIndex": index, "ifType": f"{raw} ({INTERFACE_TYPES_TO_MONITOR[if_type]})"}
+        for index, if_type, raw in monitored
     }
+    monitored_indices = [index for index, _, _ in monitored]
     
-    # Get other interface attributes
-    for name, oid in OID_CONSTANTS.items():
-        if name in ["ifIndex", "ifType"] or name.startswith("sys"):
-            continue
-            
-        values = await snmp_walk(router_ip, oid, community, port, timeout, retries)
-        await asyncio.sleep(request_interval)  # Rate limiting
-        
+    # The IP address table is independent of the attribute tables; fetch it meanwhile
+    ip_mapping = asyncio.ensure_future(
+        get_ip_to_interface_mapping(router_ip, community, port, timeout, retries, request_interval,
+                                    capture_errors)
+    )
+    
+    # Get other interface attributes, up to MAX_PARALLEL_WALKS requests at a time
+    results = None
+    get_requests = math.ceil(len(IF_ATTR_OIDS) * len(monitored_indices) / oid_batch_size)
+    if use_cache and get_requests < len(IF_ATTR_OIDS):
+        results = await _get_interface_attributes(router_ip, IF_ATTR_OIDS, monitored_indices, community, port,
+                                                  timeout, retries, bucket, oid_batch_size, capture_errors)
+        if results is None:
+            logger.warning(f"Cached interface OIDs failed for router {router_ip}, walking interface tables")
+            _oid_cache.pop(router_ip, None)
+    if results is None:
+        results = await _walk_interface_attributes(router_ip, IF_ATTR_OIDS, community, port, timeout,
+                                                   retries, bucket, capture_errors)
+    
+    for name, values in zip(IF_ATTR_OIDS, results):
         for index in monitored_indices:
             if index in values:
                 interfaces[index][name] = values[index]
@@ -262,8 +497,37 @@ async def get_monitored_interfaces(router_ip: str, community: str, port: int, ti
                 interfaces[index][name] = None
     
     # Add IP addresses to interfaces
-    ip_if_mapping = await get_ip_to_interface_mapping(router_ip, community, port, timeout, retries, request_interval)
+    ip_if_mapping = await ip_mapping
     for index in interfaces:
         interfaces[index]["ipAddresses"] = ", ".join(ip_if_mapping.get(index, []))
     
-    return interfaces
\ No newline at end of file
+    return interfaces
+
+
+async def poll_router(router_ip: str, community: str, port: int, timeout: int, retries: int,
+                      request_interval: float, capture_errors: bool = False) -> Dict[str, Any]:
+    """
+    Collect device information and monitored interfaces for a router in one pass.
+    
+    The system OID request runs concurrently with interface discovery, and the
+    IP address table is fetched alongside the interface attribute tables, so
+    the router's requests overlap within its rate limit.
+    
+    Args:
+        router_ip: IP address of the router
+        community: SNMP community string
+        port: SNMP port
+        timeout: Timeout in seconds
+        retries: Number of retries
+        request_interval: Interval between requests to the same router
+        capture_errors: Log net-snmp's error text on failure instead of only its exit status
+        
+    Returns:
+        Dict[str, Any]: {"device_info": router information, "interfaces": interfaces keyed by ifIndex}
+    """
+    device_info, interfaces = await asyncio.gather(
+        get_device_info(router_ip, community, port, timeout, retries, request_interval, capture_errors),
+        get_monitored_interfaces(router_ip, community, port, timeout, retries, request_interval,
+                                 capture_errors=capture_errors)
+    )
+    return {"device_info": device_info, "interfaces": interfaces}
\ No newline at end of file
@@ -14,6 +14,7 @@ OID_CONSTANTS = {
     "sysObjectID": "1.3.6.1.2.1.1.2.0",
     
     # IP address information
+    "ipAddrEntry": "1.3.6.1.2.1.4.20.1",
     "ipAddress": "1.3.6.1.2.1.4.20.1.1",
     "ipAdEntIfIndex": "1.3.6.1.2.1.4.20.1.2",
     
@@ -39,6 +40,19 @@ OID_CONSTANTS = {
     "ifAlias": "1.3.6.1.2.1.31.1.1.1.18",
 }
 
+# System OIDs fetched per router
+SYS_OIDS = {name: oid for name, oid in OID_CONSTANTS.items() if name.startswith("sys")}
+
+# Per-interface attribute OIDs; the ipAddrTable columns are indexed by IP and
+# ifIndex/ifType are walked separately
+IF_ATTR_OIDS = {
+    name: oid for name, oid in OID_CONSTANTS.items()
+    if name.startswith("if") and name not in ("ifIndex", "ifType")
+}
+
+# Traffic counter OIDs
+COUNTER_OIDS = {name: oid for name, oid in OID_CONSTANTS.items() if name.endswith("Octets")}
+
 # Default SNMP settings
 DEFAULT_SNMP_PORT = 161
 DEFAULT_SNMP_COMMUNITY = "public"
@@ -4,13 +4,67 @@ Parsers for SNMP response values.
 """
 
 import re
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, List, Optional, Tuple
+
+def _parse_integer(value: str) -> int:
+    """Parse an INTEGER value, including enumerated forms such as "up(1)"."""
+    if value.endswith(')'):
+        value = value[value.rindex('(') + 1:-1]
+    return int(value)
+
+
+def _parse_counter(value: str) -> int:
+    """Parse a Counter32, Counter64 or Gauge32 value, ignoring any trailing units."""
+    return int(value.split(None, 1)[0])
+
+
+def _parse_timeticks(value: str) -> int:
+    """Parse a Timeticks value such as "(12345) 0:02:03.45" into ticks."""
+    if value.startswith('('):
+        return int(value[1:value.index(')')])
+    return int(value.split(None, 1)[0])
+
+
+def _parse_hex(value: str) -> str:
+    """Parse a Hex-STRING value, formatting 6-byte values as a MAC address."""
+    hex_values = value.split()
+    if len(hex_values) == 6:  # MAC address
+        return ":".join(hex_values)
+    return value
+
+
+def _strip_quotes(value: str) -> str:
+    """Parse a STRING value, removing surrounding quotes if present."""
+    if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+        return value[1:-1]
+    return value
+
+
+# Parsers for the type prefix net-snmp prints before each value ("TYPE: value")
+_TYPE_HANDLERS = {
+    "INTEGER": _parse_integer,
+    "Counter32": _parse_counter,
+    "Counter64": _parse_counter,
+    "Gauge32": _parse_counter,
+    "Timeticks": _parse_timeticks,
+    "Hex-STRING": _parse_hex,
+    "IpAddress": str,
+    "STRING": _strip_quotes,
+}
+
+# A "TYPE:" marker anywhere in a value, for output where it is not the prefix,
+# e.g. "Wrong Type (should be Counter32): Counter32: 5"
+_TYPE_MARKER_RE = re.compile(r'(?:^|\s)(' + '|'.join(map(re.escape, _TYPE_HANDLERS)) + r'):')
 
 
 def parse_snmp_value(value_str: str) -> Union[str, int, float]:
     """
     Parse SNMP value string into appropriate Python type.
     
+    Typed values are dispatched on their "TYPE:" prefix, or on the last known
+    "TYPE:" marker when the prefix is something else; untyped values are
+    converted to int or float where possible.
+    
     Args:
         value_str: SNMP response value as string
         
@@ -24,35 +78,20 @@ def parse_snmp_value(value_str: str) -> Union[str, int, float]:
     # String value (quoted)
     if value_str.startswith('"') and value_str.endswith('"'):
         return value_str[1:-1]
-        
-    # INTEGER
-    int_match = re.search(r'INTEGER:\s*(\d+)', value_str)
-    if int_match:
-        return int(int_match.group(1))
-        
-    # Counter32, Counter64, Gauge32
-    counter_match = re.search(r'(Counter32|Counter64|Gauge32):\s*(\d+)', value_str)
-    if counter_match:
-        return int(counter_match.group(2))
-        
-    # Timeticks
-    timeticks_match = re.search(r'Timeticks:\s*\((\d+)\)', value_str)
-    if timeticks_match:
-        return int(timeticks_match.group(1))
-        
-    # Hex-STRING for MAC addresses
-    hex_match = re.search(r'Hex-STRING:\s*([0-9A-Fa-f\s]+)', value_str)
-    if hex_match:
-        # Convert space-separated hex values to MAC format
-        hex_values = hex_match.group(1).strip().split()
-        if len(hex_values) == 6:  # MAC address
-            return ":".join(hex_values)
-        return hex_match.group(1).strip()
-        
-    # IpAddress
-    ip_match = re.search(r'IpAddress:\s*(\d+\.\d+\.\d+\.\d+)', value_str)
-    if ip_match:
-        return ip_match.group(1)
+    
+    prefix, _, rest = value_str.partition(':')
+    handler = _TYPE_HANDLERS.get(prefix)
+    if handler is None:
+        # Fall back to the last typed segment, as agents may prefix a warning
+        markers = list(_TYPE_MARKER_RE.finditer(value_str))
+        if markers:
+            handler = _TYPE_HANDLERS[markers[-1].group(1)]
+            rest = value_str[markers[-1].end():]
+    if handler is not None:
+        try:
+            return handler(rest.strip())
+        except ValueError:
+            pass
         
     # Try direct conversion to int or float
     try:
@@ -65,12 +104,45 @@ def parse_snmp_value(value_str: str) -> Union[str, int, float]:
             return value_str
 
 
-def parse_snmp_walk_response(output: str) -> Dict[str, Any]:
+def parse_snmp_walk_line(line: bytes, base_oid: Optional[str] = None) -> Optional[Tuple[str, Any]]:
+    """
+    Parse one line of raw snmpwalk output.
+    
+    Only the index and the value are decoded; the OID is sliced as bytes.
+    
+    Args:
+        line: A single b"OID = value" output line
+        base_oid: Walked OID; if given, the index is everything below it
+            (e.g. "1.10.0.0.1") instead of the last OID component
+        
+    Returns:
+        Optional[Tuple[str, Any]]: (OID index, parsed value), or None if the line
+        is not a varbind
+    """
+    # Parse the OID and value; net-snmp prints "OID = value" with no leading blanks
+    eq = line.find(b' = ')
+    if eq < 0:
+        return None
+        
+    full_oid = line[:eq]
+    value_part = line[eq + 3:].strip()
+    
+    # Extract the index from the OID
+    if base_oid is not None:
+        index = full_oid.lstrip(b'.')[len(base_oid.lstrip('.')) + 1:]
+    else:
+        index = full_oid[full_oid.rfind(b'.') + 1:]
+    
+    # Parse the value using the helper function
+    return index.decode(), parse_snmp_value(value_part.decode())
+
+
+def parse_snmp_walk_response(output: bytes) -> Dict[str, Any]:
     """
     Parse the output of an SNMP walk command into a dictionary.
     
     Args:
-        output: Output string from snmpwalk command
+        output: Raw stdout from snmpwalk command
         
     Returns:
         Dict[str, Any]: Dictionary with OID indices as keys and parsed values
@@ -78,26 +150,45 @@ def parse_snmp_walk_response(output: str) -> Dict[str, Any]:
     result = {}
     
     # Process each line of output
-    for line in output.split('\n'):
-        if not line.strip():
-            continue
-            
-        # Parse the OID and value
-        parts = line.split('=', 1)
-        if len(parts) != 2:
-            continue
-            
-        full_oid = parts[0].strip()
-        value_part = parts[1].strip()
+    for line in output.splitlines():
+        parsed = parse_snmp_walk_line(line)
+        if parsed is not None:
+            index, value = parsed
+            result[index] = value
+    
+    return result
+
+
+def parse_snmp_get_response(output: str) -> Dict[str, Any]:
+    """
+    Parse the output of a multi-OID snmpget command run with numeric OIDs (-On).
+    
+    Args:
+        output: Output string from snmpget command
         
-        # Extract the index from the OID
-        oid_parts = full_oid.split('.')
-        if len(oid_parts) > 0:
-            index = oid_parts[-1]
-        else:
-            continue
+    Returns:
+        Dict[str, Any]: Dictionary with full numeric OIDs (no leading dot) as keys
+        and parsed values, or None for OIDs the agent does not have
+    """
+    # Raw value lines per OID; multi-line strings (e.g. sysDescr) continue on
+    # lines that don't start with a numeric OID
+    raw_values: Dict[str, List[str]] = {}
+    current = None
+    
+    for line in output.splitlines():
+        oid, sep, value_part = line.partition(' = ')
+        if sep and oid.startswith('.'):
+            current = raw_values[oid.lstrip('.')] = [value_part]
+        elif current is not None:
+            current.append(line)
+    
+    result = {}
+    for oid, lines in raw_values.items():
+        value_part = '\n'.join(lines).strip()
         
-        # Parse the value using the helper function
-        result[index] = parse_snmp_value(value_part)
+        if value_part.startswith(("No Such Object", "No Such Instance")):
+            result[oid] = None
+        else:
+            result[oid] = parse_snmp_value(value_part)
     
     return result
\ No newline at end of file
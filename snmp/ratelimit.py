@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiting for SNMP requests to the same router.
+"""
+
+import asyncio
+import math
+import time
+from typing import Dict
+
+
+class TokenBucket:
+    """Async token bucket allowing bursts up to capacity at a sustained rate."""
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate_per_sec: Tokens added per second; math.inf disables limiting
+            capacity: Maximum number of tokens, i.e. the burst size
+        """
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    async def acquire(self, n: float = 1):
+        """Wait until n tokens are available and take them."""
+        if self.rate == math.inf:
+            return
+        while True:
+            self._refill()
+            if self.tokens >= n:
+                self.tokens -= n
+                return
+            await asyncio.sleep((n - self.tokens) / self.rate)
+
+
+# Buckets per router IP, kept for the life of the process so pacing spans polls
+_buckets: Dict[str, TokenBucket] = {}
+
+
+def get_bucket(key: str, request_interval: float, capacity: float) -> TokenBucket:
+    """
+    Get the shared token bucket for a router, creating it if needed.
+
+    Args:
+        key: Router IP address
+        request_interval: Sustained interval between requests in seconds; 0 disables limiting
+        capacity: Number of requests that may be sent in a burst
+
+    Returns:
+        TokenBucket: The router's bucket
+    """
+    bucket = _buckets.get(key)
+    if bucket is None:
+        rate = 1.0 / request_interval if request_interval > 0 else math.inf
+        bucket = TokenBucket(rate, capacity)
+        _buckets[key] = bucket
+    return bucket
@@ -1,18 +1,55 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+# Size and count of rotated monitor.log files
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 5
+
+# Background listener writing queued log records to the real handlers
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
-    """Configure and return a logger for the application."""
+    """
+    Configure and return a logger for the application.
+    
+    Log calls only enqueue records; a background QueueListener thread writes them
+    to a rotating monitor.log and the console, keeping file I/O off the event loop.
+    """
+    global _listener
     log_level = logging.DEBUG if verbose else logging.INFO
     
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler("monitor.log"),
-            logging.StreamHandler()
-        ],
-    )
+    # Skip collecting record attributes the log format never uses
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    if _listener is None:
+        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        file_handler = logging.handlers.RotatingFileHandler(
+            "monitor.log", maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+        )
+        stream_handler = logging.StreamHandler()
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        # Only merge args into the message here; the listener's handlers add the rest
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.getLogger().addHandler(queue_handler)
+        
+        _listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        _listener.start()
+        # Flush queued records on interpreter exit
+        atexit.register(_listener.stop)
+    
+    logging.getLogger().setLevel(log_level)
     
     logger = logging.getLogger("router_monitor")
     logger.setLevel(log_level)